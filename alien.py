@@ -1,5 +1,3 @@
-# Import the pygame module
-import pygame
 # Import the Sprite class from the pygame.sprite module
 from pygame.sprite import Sprite
 
@@ -13,8 +11,8 @@ class Alien(Sprite):
         self.screen = ai_game.screen
         # Store the game settings object for later use
         self.settings = ai_game.settings
-        # Load the alien image from a file and set it as the sprite's image
-        self.image = pygame.image.load('images/alien.bmp')
+        # Get the shared alien image from the asset cache
+        self.image = ai_game.assets.load_image('Images/alien.bmp')
         # Get the rectangular area of the image
         self.rect = self.image.get_rect()
         # Set the x-coordinate of the alien to be its width from the left edge
@@ -23,6 +21,8 @@ class Alien(Sprite):
         self.rect.y = self.rect.height
         # Store the alien's exact horizontal position as a float for precise movement
         self.x = float(self.rect.x)
+        # Store the alien's index in the NumPy fleet arrays, if they are used
+        self.fleet_index = None
 
     def check_edges(self):
         """Return True if alien is at edge of screen."""
@@ -31,10 +31,10 @@ class Alien(Sprite):
         # Check if the alien is at the right edge or left edge of the screen
         return (self.rect.right >= screen_rect.right) or (self.rect.left <= 0)
 
-    def update(self):
+    def update(self, scale=1.0):
         """Move the alien to the right or left."""
         # Update the alien's horizontal position based on speed and direction
-        self.x += self.settings.alien_speed * self.settings.fleet_direction
+        self.x += self.settings.alien_speed * self.settings.fleet_direction * scale
         # Update the rect object's x-coordinate to match the calculated position
         self.rect.x = self.x
 
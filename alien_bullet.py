@@ -0,0 +1,33 @@
+# Import the pygame module
+import pygame
+# Import the Sprite class from pygame.sprite module
+from pygame.sprite import Sprite
+
+class AlienBullet(Sprite):
+    """A class to manage bullets fired down at the ship by the aliens."""
+
+    def __init__(self, ai_game):
+        """Create an alien bullet, placed when it is fired."""
+        # Call the constructor of the parent class (Sprite)
+        super().__init__()
+        # Store the game settings for easy access
+        self.settings = ai_game.settings
+        # Set the color of the bullet from the settings
+        self.color = self.settings.alien_bullet_color
+        # Create the bullet rect from the settings
+        self.rect = pygame.Rect(0, 0, self.settings.alien_bullet_width,
+            self.settings.alien_bullet_height)
+        # Store the bullet's position as a decimal value
+        self.y = 0.0
+
+    def reset(self, alien):
+        """Place the bullet just below the alien firing it."""
+        self.rect.midtop = alien.rect.midbottom
+        self.y = float(self.rect.y)
+
+    def update(self, scale=1.0):
+        """Move the bullet down the screen."""
+        # Update the decimal position of the bullet
+        self.y += self.settings.alien_bullet_speed * scale
+        # Update the rect position
+        self.rect.y = self.y
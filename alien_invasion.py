@@ -1,37 +1,86 @@
 # Import necessary modules
+import os
 import sys
+import random
+from functools import partial
 import pygame
-from time import sleep
+from time import perf_counter, perf_counter_ns
 
 # Import custom game components
-from settings import Settings
+from settings import Settings, load_profile, key_code
 from ship import Ship
 from bullet import Bullet
 from alien import Alien
+from alien_bullet import AlienBullet
+from firing_columns import FiringColumns
 from game_stats import GameStats
 from button import Button
 from scoreboard import Scoreboard
-from sound_effects import SoundEffects  # Add this import
+from sound_effects import SoundEffects, NullSoundEffects
+from asset_cache import AssetCache
+from collisions import CollisionGrid
+from fleet import ArrayFleet, fleet_layout
+from swarm import Swarm
+from renderer import Renderer
+from sprite_atlas import SpriteAtlas
+from text_cache import TextCache
+from pool import SpritePool
+from profiler import FrameProfiler
+from transitions import Transitions
+from replay import InputRecorder
+from frame_pacer import FramePacer
+from score_store import HighScoreStore
+from snapshot import save_snapshot, load_snapshot
 
 # Define the main game class
 class AlienInvasion:
     """Overall class to manage game assets and behavior."""
 
-    def __init__(self):
-        """Initialize the game, and create game resources."""
-        # Initialize Pygame modules
-        pygame.init()
-        # Create a clock object to control the game's frame rate
-        self.clock = pygame.time.Clock()
-        # Create a settings object based on the Settings class
-        self.settings = Settings()
+    def __init__(self, headless=False, seed=None, settings=None):
+        """Initialize the game, and create game resources.
+
+        With headless=True the game uses SDL's dummy video and audio
+        drivers so it can be stepped with simulate() without a window.
+        A Settings object may be passed in to replace the defaults.
+        """
+        # Note when startup begins, to measure the time to the first frame
+        self._startup_time = perf_counter()
+        self.time_to_first_frame = None
+        # Remember whether the game runs without video output
+        self.headless = headless
+        # Select SDL's dummy drivers before Pygame opens any device
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        # Initialize only the Pygame modules needed for the first frame; the
+        # mixer is opened by SoundEffects once the first frame is shown
+        pygame.display.init()
+        pygame.font.init()
+        # Create a settings object based on the Settings class, unless given one
+        self.settings = settings if settings is not None else Settings()
+        # Create the pacer that caps the frame rate and sleeps while idle
+        self.pacer = FramePacer(self)
         # Create a screen object based on the screen size settings
-        self.screen = pygame.display.set_mode(
+        self.screen = self.pacer.set_mode(
             (self.settings.screen_width, self.settings.screen_height))
         # Set the caption of the game window
         pygame.display.set_caption("Alien Invasion")
+        # Create a shared cache so every sprite reuses the same loaded images
+        self.assets = AssetCache()
+        # Create a shared cache of rendered text for the HUD and buttons
+        self.text_cache = TextCache(self.settings.text_cache_size)
         # Create an instance to store game statistics
         self.stats = GameStats(self)
+        # Create the high-score store; it reads its file on first use, and
+        # headless simulations keep their scores in memory only
+        self.high_scores = HighScoreStore(
+            None if headless else self.settings.high_score_path,
+            self.settings.high_score_entries)
+        # Keep quick saves and autosaves in this file; headless simulations
+        # never write one
+        self.snapshot_path = None if headless else self.settings.snapshot_path
+        # Count the seconds of play since the last autosave
+        self.autosave_timer = 0.0
         # Create a scoreboard
         self.scoreboard = Scoreboard(self)
         # Create a ship object and pass the current game instance to it
@@ -40,60 +89,264 @@ class AlienInvasion:
         self.bullets = pygame.sprite.Group()
         # Create a group of aliens
         self.aliens = pygame.sprite.Group()
-        # Create a fleet of aliens
-        self._create_fleet()
+        # Create pools so bullets and aliens are recycled instead of rebuilt
+        self.bullet_pool = SpritePool(lambda: Bullet(self))
+        self.alien_pool = SpritePool(lambda: Alien(self))
+        # Create a group for the aliens' bullets, and fill their pool up
+        # front; at most alien_bullets_allowed are ever in play
+        self.alien_bullets = pygame.sprite.Group()
+        self.alien_bullet_pool = SpritePool(lambda: AlienBullet(self))
+        for bullet in [self.alien_bullet_pool.acquire()
+                for _ in range(self.settings.alien_bullets_allowed)]:
+            self.alien_bullet_pool.release(bullet)
+        # Track the lowest alien of each column to pick who fires
+        self.firing_columns = FiringColumns()
+        # Count the seconds since the aliens last fired
+        self.alien_fire_timer = 0.0
+        # Keep the aliens of the fleet so each new fleet reuses them
+        self.fleet_aliens = []
+        self._alien_dimensions = None
+        # Create a grid indexing the aliens for fast collision checks
+        self.alien_grid = CollisionGrid(self.settings.collision_cell_size)
+        # Create the NumPy fleet arrays if that backend is selected
+        self.array_fleet = None
+        if self.settings.fleet_backend == 'numpy':
+            self.array_fleet = ArrayFleet(self)
+        # Stream endless waves instead of single fleets in endless mode
+        self.swarm = None
+        if self.settings.game_mode == 'endless':
+            self.swarm = Swarm(self)
         # Start Alien Invasion in an inactive state
         self.game_active = False
-        # Create a play button
+        # Create a play button, which also creates the difficulty buttons
         self.play_button = Button(self, "Play")
-        # Create difficulty buttons
-        self.play_button.create_difficulty_buttons()
-        # Create a SoundEffects instance
-        self.sound_effects = SoundEffects()
+        # Pack the ship, alien and bullet images into one surface for drawing
+        self.atlas = SpriteAtlas({
+            'ship': self.ship.image,
+            'alien': self.assets.load_image('Images/alien.bmp'),
+            'bullet': ((self.settings.bullet_width, self.settings.bullet_height),
+                self.settings.bullet_color),
+            'alien_bullet': ((self.settings.alien_bullet_width,
+                self.settings.alien_bullet_height), self.settings.alien_bullet_color),
+        })
+        # Create the renderer that draws each frame
+        self.renderer = Renderer(self)
+        # Create a SoundEffects instance, loading the sounds after the first frame;
+        # headless runs and muted games skip the mixer entirely
+        if headless or not self.settings.sound_enabled:
+            self.sound_effects = NullSoundEffects(self)
+        else:
+            self.sound_effects = SoundEffects(
+                self, background=self.settings.load_sounds_in_background)
+        # Create a seeded random generator so simulations are reproducible,
+        # picking a seed if none is given so it can be recorded
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Count the logical frames the game has simulated
+        self.frame_count = 0
+        # Store the length of the current frame in seconds, and how far it
+        # moves things relative to one reference frame
+        self.frame_time = self.settings.timestep
+        self.frame_scale = 1.0
+        # Keep the time not yet simulated when running in fixed steps
+        self.step_time = 0.0
+        # Create the state machine for pauses, skipped in headless simulations
+        self.transitions = Transitions(skip=headless)
+        # Record the input if a recording path is set
+        self.recorder = None
+        if self.settings.record_path:
+            self.recorder = InputRecorder(self)
+        # Create the profiler that times each phase of a frame
+        self.profiler = FrameProfiler(self)
+        # List the phases that update an active game, in order
+        self.game_phases = [
+            ('ship', self._update_ship),
+            ('bullets', self._update_bullets),
+            ('collisions', self._check_bullet_alien_collisions),
+            ('aliens', self._update_aliens),
+            ('alien_fire', self._update_alien_fire),
+        ]
+        # Let the swarm send in new waves after the aliens move in endless mode
+        if self.swarm is not None:
+            self.game_phases.append(('swarm', self._update_swarm))
+        # Route events and keys through lookup tables
+        self._build_input_tables()
 
     def run_game(self):
         """Start the main loop for the game."""
         # Start the main game loop
         while True:
+            # While nothing is moving, sleep until input arrives instead of
+            # redrawing an unchanged screen, and handle that input at once
+            if self._is_idle():
+                event = self.pacer.wait_for_event()
+                if event is not None:
+                    self._handle_event(event)
+            # Note when the frame starts, to time it if profiling is on
+            frame_start = perf_counter_ns()
             # Check for events
-            self._check_events()
-            # If game is active, update game elements
-            if self.game_active:
-                # Update the ship's position
-                self.ship.update()
-                # Update the bullets
-                self._update_bullets()
-                # Update the aliens
-                self._update_aliens()
+            self.profiler.run('events', self._check_events)
+            # Measure the time the last frame took
+            frame_time = self.pacer.frame_time()
+            # Advance the game by that time; recorded sessions always use
+            # whole fixed timesteps so they replay exactly
+            if self.recorder is not None or self.settings.fixed_step:
+                self._advance_fixed_steps(frame_time)
+            else:
+                self._update_game(frame_time)
             # Update the screen
-            self._update_screen()
-            # Adjust the frame rate to 60 frames per second
-            self.clock.tick(60)
-            
+            self.profiler.run('screen', self._update_screen)
+            # Record the time spent on the whole frame
+            if self.profiler.enabled:
+                self.profiler.record('frame', perf_counter_ns() - frame_start)
+            # Hold the target frame rate
+            self.pacer.tick()
+
+    def _is_idle(self):
+        """Return True if nothing on screen would change without input."""
+        # Never sleep before the first frame is shown, so the menu appears at once
+        return (self.settings.idle_mode and self.time_to_first_frame is not None
+            and not self.game_active
+            and not self.transitions.active and not self.profiler.overlay_visible)
+
+    def simulate(self, frames, inputs=None):
+        """Run the game logic for a number of frames without rendering.
+
+        inputs maps a frame number to a list of events to handle on that
+        frame, or is a callable taking (game, frame) and returning such a
+        list. Each frame is one fixed logical timestep of
+        settings.timestep seconds, with no frame cap.
+        """
+        # Step the game as fast as possible for the requested frames
+        for _ in range(frames):
+            # Look up the scripted events for this frame
+            if callable(inputs):
+                events = inputs(self, self.frame_count)
+            elif inputs:
+                events = inputs.get(self.frame_count, ())
+            else:
+                events = ()
+            # Feed the scripted events through the normal event handlers
+            for event in events or ():
+                self._handle_event(event)
+            # Advance the game by one logical frame
+            self._update_game()
+
+    def _advance_fixed_steps(self, frame_time):
+        """Run as many fixed timesteps as fit in the time built up so far."""
+        # Add the frame's time to what was left over from earlier frames
+        self.step_time += frame_time
+        timestep = self.settings.timestep
+        # Run whole steps, allowing for rounding in the summed frame times
+        while self.step_time >= timestep - 1e-9:
+            self._update_game()
+            self.step_time -= timestep
+
+    def _update_game(self, dt=None):
+        """Advance the game state by one logical frame lasting dt seconds."""
+        # Use the fixed logical timestep unless a frame time is given
+        if dt is None:
+            dt = self.settings.timestep
+        # Scale the per-frame speeds to the length of this frame
+        self.frame_time = dt
+        self.frame_scale = dt * self.settings.speed_reference_fps
+        # Let each sound start again in this frame
+        self.sound_effects.begin_frame()
+        # While a transition is running, only let its clock advance
+        if self.transitions.active:
+            self.transitions.update(dt)
+        # If game is active, update the ship, bullets, collisions and aliens
+        elif self.game_active:
+            for name, phase in self.game_phases:
+                self.profiler.run(name, phase)
+                # Skip the remaining phases once the game ends or pauses, so
+                # the ship cannot be hit again in the same frame
+                if not self.game_active or self.transitions.active:
+                    break
+            # Save the game now and then so it can be recovered after a crash
+            self._autosave(dt)
+        # Count the live entities while profiling
+        if self.profiler.enabled:
+            self.profiler.set_counter('aliens', len(self.aliens))
+            self.profiler.set_counter('bullets', len(self.bullets))
+            # Show how well the image and text caches are working
+            assets = self.assets.stats()
+            self.profiler.set_counter('image loads', assets['loads'])
+            self.profiler.set_counter('image hits', assets['hits'])
+            text = self.text_cache.stats()
+            self.profiler.set_counter('text hits', text['hits'])
+            self.profiler.set_counter('text misses', text['misses'])
+            self.profiler.set_counter('text evictions', text['evictions'])
+        # Count the frame
+        self.frame_count += 1
+
     def _check_events(self):
         """Respond to keypresses and mouse events."""
         # Iterate through all events in the Pygame event queue
         for event in pygame.event.get():
-            # Check if the user has clicked the close button
-            if event.type == pygame.QUIT:
-                # Quit the game by exiting the program
-                sys.exit()
-            # Check if a key has been pressed down
-            elif event.type == pygame.KEYDOWN:
-                # Handle key press events using a separate method
-                self._check_keydown_events(event)
-            # Check if a key has been released
-            elif event.type == pygame.KEYUP:
-                # Handle key release events using a separate method
-                self._check_keyup_events(event)
-            # Check if a mouse button has been pressed
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Get the current position of the mouse cursor
-                mouse_pos = pygame.mouse.get_pos()
-                # Check if the play button has been clicked
-                self._check_play_button(mouse_pos)
-                # Check if a difficulty button has been clicked
-                self._check_difficulty_buttons(mouse_pos)
+            # Handle each event using a separate method
+            self._handle_event(event)
+
+    def _handle_event(self, event):
+        """Respond to a single keypress or mouse event."""
+        # Log the event for replay if the session is being recorded
+        if self.recorder is not None:
+            self.recorder.record(self.frame_count, event)
+        # Look up the handler for the event type; other types are ignored
+        handler = self.event_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _quit(self):
+        """Save the high scores, recording and profiler results, then exit."""
+        # Keep a game still in progress so it can be resumed; its score is
+        # submitted when it ends, so only submit it now if it cannot be saved
+        if self.game_active and not self._save_snapshot():
+            self._submit_score()
+        self.high_scores.save()
+        # Write the recorded input so the session can be replayed
+        if self.recorder is not None:
+            self.recorder.save(self.settings.record_path)
+        # Write the frame timings if an export path is set and any were taken
+        if self.settings.profile_export_path and self.profiler.samples:
+            self.profiler.export(self.settings.profile_export_path)
+        # Quit the game by exiting the program
+        sys.exit()
+
+    def _save_snapshot(self):
+        """Save the game to the snapshot file; return True if it was saved."""
+        if self.snapshot_path is None:
+            return False
+        try:
+            save_snapshot(self, self.snapshot_path)
+        except OSError:
+            # Keep playing if the snapshot cannot be written
+            return False
+        return True
+
+    def _load_snapshot(self):
+        """Restore the game saved in the snapshot file, if there is one."""
+        # A recorded session could not be replayed past a restore
+        if self.snapshot_path is None or self.recorder is not None:
+            return
+        try:
+            load_snapshot(self, self.snapshot_path)
+        except (OSError, ValueError):
+            # Keep the current game if there is no usable snapshot
+            return
+        self.autosave_timer = 0.0
+
+    def _autosave(self, dt):
+        """Save the game once every autosave_interval seconds of play."""
+        interval = self.settings.autosave_interval
+        if not interval or self.snapshot_path is None:
+            return
+        self.autosave_timer += dt
+        if self.autosave_timer >= interval:
+            self.autosave_timer = 0.0
+            self._save_snapshot()
 
     def _check_play_button(self, mouse_pos):
         """Start a new game when the player clicks Play."""
@@ -101,6 +354,13 @@ class AlienInvasion:
         button_clicked = self.play_button.rect.collidepoint(mouse_pos)
         # If the button was clicked and the game is not active, initialize a new game
         if button_clicked and not self.game_active:
+            # Start a new game
+            self.start_game()
+
+    def start_game(self):
+        """Reset the game state and start a new game."""
+        # Only start a new game if one is not already running
+        if not self.game_active:
             # Reset the game settings to their initial values
             self.settings.initialize_dynamic_settings()
             # Reset the game statistics (score, ships left, etc.)
@@ -110,13 +370,16 @@ class AlienInvasion:
             # Set the game to active state to start gameplay
             self.game_active = True
             # Remove any remaining aliens from the previous game
-            self.aliens.empty()
-            # Remove any remaining bullets from the previous game
-            self.bullets.empty()
+            self._clear_aliens()
+            # Recycle any remaining bullets from the previous game
+            self.bullet_pool.release_group(self.bullets)
+            self.alien_bullet_pool.release_group(self.alien_bullets)
             # Create a new fleet of aliens for the new game
             self._create_fleet()
             # Center the player's ship on the screen
             self.ship.center_ship()
+            # Drop any pause left over from the previous game
+            self.transitions.cancel()
             # Hide the mouse cursor during gameplay
             pygame.mouse.set_visible(False)
 
@@ -130,68 +393,162 @@ class AlienInvasion:
                 self.settings.difficulty = difficulty.lower()
                 # Initialize dynamic settings based on the new difficulty
                 self.settings.initialize_dynamic_settings()
+                # Show the best score for the new difficulty
+                self._show_stored_high_score()
+                # The buttons do not overlap, so no other one can be hit
+                break
+
+    def _show_stored_high_score(self):
+        """Show the best stored score for the current difficulty."""
+        self.stats.high_score = self.high_scores.best(self._leaderboard_name())
+        self.scoreboard.prep_high_score()
+
+    def _submit_score(self):
+        """Add the finished game's score to the leaderboard and save it."""
+        self.high_scores.submit(self._leaderboard_name(), self.stats.score, self.stats.level)
+        self.high_scores.save()
+
+    def _leaderboard_name(self):
+        """Return the leaderboard for the current difficulty and game mode."""
+        # Endless games keep separate leaderboards, since they score differently
+        if self.swarm is not None:
+            return f'endless {self.settings.difficulty}'
+        return self.settings.difficulty
 
     def _check_keydown_events(self, event):
         """Respond to key presses."""
-        # Move ship right if right arrow key is pressed
-        if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = True
-        # Move ship left if left arrow key is pressed
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = True
-        # Quit game if 'Q' key is pressed
-        elif event.key == pygame.K_q:
-            sys.exit()
-        # Fire bullet if spacebar is pressed
-        elif event.key == pygame.K_SPACE:
-            self._fire_bullet()
+        # Run the action bound to the key, if any
+        action = self.keydown_actions.get(event.key)
+        if action is not None:
+            action()
 
     def _check_keyup_events(self, event):
-        """Respond to key releases."""  
-        # Stop moving ship right when right arrow key is released
-        if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = False
-        # Stop moving ship left when left arrow key is released
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = False
+        """Respond to key releases."""
+        # Run the release action bound to the key, if any
+        action = self.keyup_actions.get(event.key)
+        if action is not None:
+            action()
+
+    def _check_mouse_events(self, event):
+        """Respond to mouse clicks on the menu buttons."""
+        # The buttons only respond while the game is inactive
+        if not self.game_active:
+            # Use the position stored in the event so scripted clicks work
+            mouse_pos = event.pos
+            # Check if the play button has been clicked
+            self._check_play_button(mouse_pos)
+            # Check if a difficulty button has been clicked
+            self._check_difficulty_buttons(mouse_pos)
+
+    def _build_input_tables(self):
+        """Build the lookup tables that route events and keys to handlers."""
+        # Map each handled event type to its handler
+        self.event_handlers = {
+            pygame.QUIT: lambda event: self._quit(),
+            pygame.KEYDOWN: self._check_keydown_events,
+            pygame.KEYUP: self._check_keyup_events,
+            # Redraw the whole window if the system discarded its contents
+            pygame.WINDOWEXPOSED: lambda event: self.renderer.invalidate(),
+            pygame.MOUSEBUTTONDOWN: self._check_mouse_events,
+        }
+        # Map each action to what happens when its key is pressed and released
+        actions = {
+            'move_right': (partial(setattr, self.ship, 'moving_right', True),
+                partial(setattr, self.ship, 'moving_right', False)),
+            'move_left': (partial(setattr, self.ship, 'moving_left', True),
+                partial(setattr, self.ship, 'moving_left', False)),
+            'fire': (self._fire_bullet, None),
+            'quit': (self._quit, None),
+            'toggle_profiler': (self.profiler.toggle_overlay, None),
+            'save_snapshot': (self._save_snapshot, None),
+            'load_snapshot': (self._load_snapshot, None),
+        }
+        # Bind the keys named in the settings to the actions
+        self.keydown_actions = {}
+        self.keyup_actions = {}
+        for action, key_name in self.settings.key_bindings.items():
+            if action not in actions:
+                raise ValueError(f"key_bindings: unknown action {action!r}")
+            key = key_code(key_name)
+            press, release = actions[action]
+            self.keydown_actions[key] = press
+            if release is not None:
+                self.keyup_actions[key] = release
+        # Let SDL queue only the event types that are handled, so mouse
+        # motion and other unused events never have to be drained
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.event_handlers))
+
+    def _clear_aliens(self):
+        """Remove every alien; the swarm's aliens go back to the pool."""
+        self.firing_columns.clear()
+        if self.swarm is not None:
+            self.alien_pool.release_group(self.aliens)
+        else:
+            # The fleet keeps its aliens for the next fleet
+            self.aliens.empty()
+
+    def _update_swarm(self):
+        """Send in the next wave of the endless swarm when it is due."""
+        self.swarm.update(self.frame_time)
 
     def _create_fleet(self):
-        """Create the fleet of aliens."""
-        # Create an instance of the Alien class
-        alien = Alien(self)
-        # Get the width and height of the alien image
-        alien_width, alien_height = alien.rect.size
-        # Set the initial x-coordinate and y-coordinate for alien placement
-        current_x, current_y = alien_width, alien_height
-        # Create rows of aliens until 3 alien heights from screen bottom
-        while current_y < (self.settings.screen_height - 5 * alien_height):
-            # Create aliens in a row, placing them 2 widths apart horizontally
-            while current_x < (self.settings.screen_width - 2 * alien_width):
-                # Create an alien at the current position
-                self._create_alien(current_x, current_y)
-                # Move to the next horizontal position
-                current_x += 2 * alien_width
-            
-            # Reset the x-coordinate for the next row
-            current_x = alien_width
-            # Move the y-coordinate down by two alien heights
-            current_y += 2 * alien_height
-            
-    def _create_alien(self, x_position, y_position):
-        """Create an alien and place it in the row."""
-        # Create a new alien instance
-        new_alien = Alien(self)
-        # Set the x-coordinate of the new alien
-        new_alien.x = x_position
-        # Update the rect attribute to match the new x-coordinate
-        new_alien.rect.x = x_position
-        # Set the y-coordinate of the new alien
-        new_alien.rect.y = y_position
-        # Add the new alien to the aliens group
-        self.aliens.add(new_alien)
-    
+        """Create the fleet of aliens, reusing the aliens of earlier fleets."""
+        # In endless mode the swarm streams in waves instead
+        if self.swarm is not None:
+            self.swarm.start(self._alien_size())
+            return
+        # Look up the cached layout for this screen and alien size
+        alien_width, alien_height = self._alien_size()
+        layout = fleet_layout(self.settings.screen_width, self.settings.screen_height,
+            alien_width, alien_height)
+        # Take aliens from the pool only the first time the fleet is built
+        fleet = self.fleet_aliens
+        while len(fleet) < len(layout):
+            fleet.append(self.alien_pool.acquire())
+        aliens = fleet[:len(layout)]
+        if self.array_fleet is not None:
+            # Bind the aliens to the NumPy arrays once, then restore in bulk
+            if self.array_fleet.sprites != aliens:
+                self._place_aliens(aliens, layout)
+                self.array_fleet.bind(aliens)
+            else:
+                self.array_fleet.restore(layout)
+        else:
+            # Move each alien back to its starting position
+            self._place_aliens(aliens, layout)
+        # Add the whole fleet to the aliens group at once
+        self.aliens.add(aliens)
+        # Sort the new fleet into firing columns
+        self.firing_columns.clear()
+        self.firing_columns.add(aliens)
+        # Index the new fleet for collision checks
+        self.alien_grid.build(self.aliens)
+
+    def _alien_size(self):
+        """Return the width and height of an alien, measured only once."""
+        if self._alien_dimensions is None:
+            # Borrow an alien from the pool to get the size of its image
+            alien = self.alien_pool.acquire()
+            self._alien_dimensions = alien.rect.size
+            self.alien_pool.release(alien)
+        return self._alien_dimensions
+
+    def _place_aliens(self, aliens, layout):
+        """Move each alien to its position in the layout."""
+        for alien, (x_position, y_position) in zip(aliens, layout):
+            # Set the x-coordinate of the alien
+            alien.x = x_position
+            # Update the rect attribute to match the new position
+            alien.rect.topleft = (x_position, y_position)
+
     def _check_fleet_edges(self):
         """Respond appropriately if any aliens have reached an edge."""
+        # Let the NumPy fleet check every alien at once if it is used
+        if self.array_fleet is not None:
+            if self.array_fleet.at_edge():
+                self._change_fleet_direction()
+            return
         # Check each alien in the fleet
         for alien in self.aliens.sprites():
             # If an alien has reached an edge, change fleet direction and break
@@ -202,43 +559,100 @@ class AlienInvasion:
     def _change_fleet_direction(self):
         """Drop the entire fleet and change the fleet's direction."""
         # Move each alien down by the fleet drop speed
-        for alien in self.aliens.sprites():
-            alien.rect.y += self.settings.fleet_drop_speed
+        if self.array_fleet is not None:
+            self.array_fleet.drop(self.settings.fleet_drop_speed)
+        else:
+            for alien in self.aliens.sprites():
+                alien.rect.y += self.settings.fleet_drop_speed
         # Reverse the fleet direction
         self.settings.fleet_direction *= -1
 
     def _fire_bullet(self):
         """Create a new bullet and add it to the bullets group."""
-        # Check if the number of bullets is less than the allowed limit
-        if len(self.bullets) < self.settings.bullets_allowed:
-            # Create a new bullet
-            new_bullet = Bullet(self)
+        # Check if the number of bullets is less than the allowed limit,
+        # and ignore shots fired while the game is paused for a transition
+        if len(self.bullets) < self.settings.bullets_allowed and not self.transitions.active:
+            # Take a bullet from the pool and place it at the ship
+            new_bullet = self.bullet_pool.acquire()
+            new_bullet.reset()
             # Add the new bullet to the bullets group
             self.bullets.add(new_bullet)
             # Play the bullet sound effect
             self.sound_effects.play_bullet_sound()
 
+    def _fire_alien_bullet(self):
+        """Fire a bullet from the lowest alien of a random column, if allowed."""
+        # Keep within the fixed budget of alien bullets
+        if len(self.alien_bullets) >= self.settings.alien_bullets_allowed:
+            return False
+        # Pick a shooter without scanning the fleet
+        shooter = self.firing_columns.pick_shooter(self.rng)
+        if shooter is None:
+            return False
+        bullet = self.alien_bullet_pool.acquire()
+        bullet.reset(shooter)
+        self.alien_bullets.add(bullet)
+        return True
+
+    def _update_alien_fire(self):
+        """Let the aliens fire, move their bullets and check for ship hits."""
+        # Fire when the next shot is due, or as soon as a bullet is free
+        rate = self.settings.alien_fire_rate
+        if rate > 0:
+            self.alien_fire_timer += self.frame_time
+            if self.alien_fire_timer >= 1 / rate and self._fire_alien_bullet():
+                self.alien_fire_timer = 0.0
+        if not self.alien_bullets:
+            return
+        # Move the bullets down the screen
+        self.alien_bullets.update(self.frame_scale)
+        ship_rect = self.ship.rect
+        screen_bottom = self.settings.screen_height
+        for bullet in self.alien_bullets.sprites():
+            # Only bullets that reached the ship's height can hit it
+            if bullet.rect.bottom < ship_rect.top:
+                continue
+            if bullet.rect.colliderect(ship_rect):
+                self._ship_hit()
+                return
+            # Recycle bullets that have left the bottom of the screen
+            if bullet.rect.top >= screen_bottom:
+                bullet.kill()
+                self.alien_bullet_pool.release(bullet)
+
+    def _update_ship(self):
+        """Move the ship for the length of this frame."""
+        self.ship.update(self.frame_scale)
+
     def _update_bullets(self):
         """Update the position of the bullets and get rid of old bullets."""
-        # Update the position of all bullets
-        self.bullets.update()
-        # Remove bullets that have gone off the screen
-        for bullet in self.bullets.copy():
-            # Check if the bullet has gone off the top of the screen
-            if bullet.rect.bottom <= 0:
-                # Remove the bullet from the group
-                self.bullets.remove(bullet)
-        # Check for any bullets that have hit aliens
-        self._check_bullet_alien_collisions()
+        # Update the position of all bullets; bullets that go off the top of
+        # the screen recycle themselves during this pass
+        self.bullets.update(self.frame_scale)
         
     def _check_bullet_alien_collisions(self):
         """Respond to bullet-alien collisions."""
-        # Check for collisions between bullets and aliens
-        collisions = pygame.sprite.groupcollide(self.bullets, self.aliens, True, True) 
+        # Check for collisions between bullets and aliens using the alien grid
+        collisions = self.alien_grid.collide_group(self.bullets, True, True)
+        # Return the bullets that collided to their pool; the destroyed
+        # aliens stay with the fleet and are reused by the next one, or in
+        # endless mode go back to the pool for later waves
+        for bullet in collisions:
+            self.bullet_pool.release(bullet)
+        # Take the destroyed aliens out of their firing columns
+        for aliens in collisions.values():
+            for alien in aliens:
+                self.firing_columns.remove(alien)
+                if self.swarm is not None:
+                    self.alien_pool.release(alien)
         # If there are collisions, update the score and play explosion sound
         if collisions:
             # Play the explosion sound effect
             self.sound_effects.play_explosion_sound()
+            # Mark the destroyed aliens as dead in the NumPy fleet
+            if self.array_fleet is not None:
+                for aliens in collisions.values():
+                    self.array_fleet.remove(aliens)
             # For each alien in the collisions, update the score
             for aliens in collisions.values():  
                 # The score is increased by the number of aliens times the points per alien
@@ -247,50 +661,74 @@ class AlienInvasion:
             self.scoreboard.prep_score()
             # Check for a new high score
             self.scoreboard.check_high_score()
-        # If all aliens are destroyed, create a new fleet
-        if not self.aliens:
+        # If all aliens are destroyed, create a new fleet; the endless
+        # swarm sends in its next wave instead
+        if not self.aliens and self.swarm is None:
             # Start a new level
             self._start_new_level()
     
     def _start_new_level(self):
         """Start a new level."""
-        # Destroy existing bullets
-        self.bullets.empty()
+        # Recycle existing bullets
+        self.bullet_pool.release_group(self.bullets)
+        self.alien_bullet_pool.release_group(self.alien_bullets)
         # Create a new fleet
         self._create_fleet()
-        # Increase game speed
-        self.settings.increase_speed()
         # Increase the game level
         self.stats.level += 1
+        # Look up the speeds and points of the new level
+        self.settings.apply_level(self.stats.level)
         # Update the level display
         self.scoreboard.prep_level()
+        # Pause briefly before the new level starts, if configured
+        self.transitions.start('level_start', self.settings.level_start_pause)
 
     def _ship_hit(self):
         """Respond to the ship being hit by an alien."""
+        # A game that is already over cannot lose another ship, so its
+        # score is only submitted once; an invincible ship loses none
+        if not self.game_active or self.settings.invincible:
+            return
         # Check if there are ships left
         if self.stats.ships_left > 0:
             # Decrement ships_left
             self.stats.ships_left -= 1
             # Update the ship display
             self.scoreboard.prep_ships()
-            # Get rid of any remaining aliens and bullets
-            self.aliens.empty()
-            # Empty the bullets group
-            self.bullets.empty()
+            # Get rid of any remaining aliens
+            self._clear_aliens()
+            # Recycle the bullets
+            self.bullet_pool.release_group(self.bullets)
+            self.alien_bullet_pool.release_group(self.alien_bullets)
             # Create a new fleet
             self._create_fleet()
             # Center the ship
             self.ship.center_ship()
-            # Pause for a moment
-            sleep(0.5)
+            # Pause for a moment without blocking events or drawing
+            self.transitions.start('respawn', self.settings.respawn_pause)
         else:
             # Set game to inactive state if no ships left
             self.game_active = False
+            # Store the score now, away from the collision checks
+            self._submit_score()
             # Show the mouse cursor
             pygame.mouse.set_visible(True)
 
     def _check_aliens_bottom(self):
-        """Check if any aliens have reached the bottom of the screen."""
+        """Check if any aliens have reached the bottom of the screen.
+
+        Returns True if one has, after treating it as a ship hit.
+        """
+        # With an invincible ship the aliens that land are removed instead
+        if self.settings.invincible:
+            self._remove_landed_aliens()
+            return False
+        # Let the NumPy fleet check every alien at once if it is used
+        if self.array_fleet is not None:
+            if self.array_fleet.reached_bottom():
+                self._ship_hit()
+                return True
+            return False
         # Get the rectangle of the screen
         screen_rect = self.screen.get_rect()
         # Check each alien in the fleet
@@ -299,47 +737,65 @@ class AlienInvasion:
             if alien.rect.bottom >= screen_rect.bottom:
                 # Call the ship_hit method
                 self._ship_hit()
-                # Exit the loop after the first alien reaches the bottom
-                break
+                # Stop after the first alien reaches the bottom
+                return True
+        return False
     
+    def _remove_landed_aliens(self):
+        """Remove the aliens that have reached the bottom of the screen."""
+        screen_bottom = self.settings.screen_height
+        landed = [alien for alien in self.aliens.sprites()
+            if alien.rect.bottom >= screen_bottom]
+        if not landed:
+            return
+        for alien in landed:
+            alien.kill()
+            self.firing_columns.remove(alien)
+            # The swarm's aliens go back to the pool for later waves
+            if self.swarm is not None:
+                self.alien_pool.release(alien)
+        # Mark them as dead in the NumPy fleet, and drop them from the grid
+        if self.array_fleet is not None:
+            self.array_fleet.remove(landed)
+        self.alien_grid.build(self.aliens)
+
     def _update_aliens(self):
         """Update the position of the aliens."""
         # Check if the fleet is at an edge
         self._check_fleet_edges()
         # Update the positions of all aliens in the fleet
-        self.aliens.update()
-        # Check if any aliens have reached the bottom of the screen
-        self._check_aliens_bottom()
+        if self.array_fleet is not None:
+            self.array_fleet.update(self.frame_scale)
+        else:
+            self.aliens.update(self.frame_scale)
+        # Re-index the moved fleet for this frame's collision checks
+        self.alien_grid.build(self.aliens)
+        # Check if any aliens have reached the bottom of the screen; the ship
+        # is only hit once per frame
+        if self._check_aliens_bottom():
+            return
         # Check for alien-ship collisions
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
+        if self.alien_grid.collide_any(self.ship):
             # Call the ship_hit method if there's a collision
             self._ship_hit()
     
     def _update_screen(self):
-        """Update images on the screen, and flip to the new screen."""
-        # Fill the screen with the background color
-        self.screen.fill(self.settings.bg_color)
-        # Draw all bullets on the screen
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()    
-        # Draw the ship on the screen
-        self.ship.blitme() 
-        # Draw all aliens on the screen
-        self.aliens.draw(self.screen)
-        # Draw the scoreboard
-        self.scoreboard.show_score()
-        # Draw the play button if the game is not active
-        if not self.game_active:
-            # Draw the main play button
-            self.play_button.draw_button()
-            # Draw the difficulty buttons
-            self.play_button.draw_difficulty_buttons(self)
-        # Update the display
-        pygame.display.flip() 
+        """Draw the bullets, ship, aliens, scoreboard and buttons."""
+        # Let the renderer redraw only what changed since the last frame
+        self.renderer.render()
+        # Measure how long startup took once the first frame is shown
+        if self.time_to_first_frame is None:
+            self.time_to_first_frame = perf_counter() - self._startup_time
+            # Load the stored high score now that the window is showing
+            self._show_stored_high_score()
+            # Open the mixer and start decoding the sounds, if deferred
+            self.sound_effects.open()
 
 # Check if this script is being run as the main program
 if __name__ == '__main__':
+    # Load the settings profile named on the command line, if any
+    settings = load_profile(sys.argv[1]) if len(sys.argv) > 1 else None
     # Create a game instance
-    ai = AlienInvasion()
+    ai = AlienInvasion(settings=settings)
     # Run the game
     ai.run_game()
\ No newline at end of file
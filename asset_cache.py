@@ -0,0 +1,35 @@
+# Import the pygame module
+import pygame
+
+class AssetCache:
+    """A class to load each image once and share it between sprites."""
+
+    def __init__(self):
+        """Initialize an empty cache and its counters."""
+        # Map each image path to its loaded Surface
+        self.images = {}
+        # Count how many requests were served from the cache
+        self.hits = 0
+        # Count how many images were actually read from disk
+        self.loads = 0
+
+    def load_image(self, path, alpha=False):
+        """Return the Surface for path, loading it from disk only once."""
+        # Serve the image from the cache if it was loaded before
+        image = self.images.get(path)
+        if image is not None:
+            self.hits += 1
+            return image
+        # Otherwise read and decode the image from disk
+        image = pygame.image.load(path)
+        self.loads += 1
+        # Convert it to the display's pixel format; the game creates the
+        # cache after opening the display
+        image = image.convert_alpha() if alpha else image.convert()
+        # Store the image so every sprite shares the same Surface
+        self.images[path] = image
+        return image
+
+    def stats(self):
+        """Return the cache counters as a dictionary."""
+        return {'hits': self.hits, 'loads': self.loads, 'cached': len(self.images)}
@@ -0,0 +1,208 @@
+"""Run many headless games in parallel to help balance the difficulty.
+
+Every combination of the --vary values is played by a simple AI player
+once per seed, spread over a pool of worker processes, and the results
+are aggregated into one table:
+
+    python batch_runner.py --vary difficulty=normal,difficult \\
+        --vary speedup_scale=1.05,1.1,1.2 --seeds 8 --workers 8
+
+--set applies one value to every run, for example
+--set 'difficulty_scale={"normal": 1.0, "difficult": 1.8}'. Values are
+read as JSON when possible and as plain strings otherwise. --profile
+starts every run from a settings profile such as profiles/arcade.json.
+"""
+# Import modules for parsing options, running processes and reporting
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import pygame
+
+from settings import ProfileError, Settings, load_profile
+
+# Build the player's events once; every run reuses them
+FIRE = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+MOVES = {
+    -1: [pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)],
+    0: [pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT),
+        pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT)],
+    1: [pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)],
+}
+
+
+class SimplePlayer:
+    """A simple AI that chases the lowest alien and fires whenever it can."""
+
+    def __init__(self, reaction_frames=6):
+        """Initialize the player, choosing a new target every reaction_frames."""
+        self.reaction_frames = reaction_frames
+        self.direction = 0
+        self.target_x = None
+
+    def __call__(self, game, frame):
+        """Return the events the player presses on this frame."""
+        events = []
+        # Pick the lowest alien as the target every few frames
+        if frame % self.reaction_frames == 0 and game.aliens:
+            lowest = max(game.aliens, key=lambda alien: alien.rect.bottom)
+            self.target_x = lowest.rect.centerx
+        # Steer the ship under the target
+        direction = 0
+        if self.target_x is not None:
+            offset = self.target_x - game.ship.rect.centerx
+            if abs(offset) > game.ship.rect.width // 4:
+                direction = 1 if offset > 0 else -1
+        if direction != self.direction:
+            self.direction = direction
+            events.extend(MOVES[direction])
+        # Fire whenever another bullet is allowed
+        if len(game.bullets) < game.settings.bullets_allowed:
+            events.append(FIRE)
+        return events
+
+
+def parse_value(text):
+    """Return text read as JSON, or as a plain string if it is not JSON."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def make_settings(overrides, profile=None):
+    """Return settings from the profile with the overrides applied.
+
+    The overrides are validated like a profile, so a misspelled name or a
+    value of the wrong type raises ProfileError.
+    """
+    settings = load_profile(profile) if profile else Settings()
+    settings.apply_profile(overrides)
+    return settings
+
+
+def run_simulation(job):
+    """Play one game headless and return its results."""
+    # Import the game inside the worker process
+    from alien_invasion import AlienInvasion
+
+    overrides, seed, max_frames, profile = job
+    settings = make_settings(overrides, profile)
+    game = AlienInvasion(headless=True, seed=seed, settings=settings)
+    game.start_game()
+    player = SimplePlayer()
+    start = perf_counter()
+    # Play in chunks until the game is over or the frame budget is spent
+    while game.game_active and game.frame_count < max_frames:
+        game.simulate(min(600, max_frames - game.frame_count), player)
+    elapsed = perf_counter() - start
+    return {
+        'overrides': overrides,
+        'seed': seed,
+        'level': game.stats.level,
+        'score': game.stats.score,
+        'frames_survived': game.frame_count,
+        'game_over': not game.game_active,
+        'seconds': elapsed,
+    }
+
+
+def make_jobs(fixed, varied, seeds, max_frames, profile=None):
+    """Return one job per combination of the varied settings and seed."""
+    names = list(varied)
+    jobs = []
+    for values in itertools.product(*(varied[name] for name in names)):
+        overrides = dict(fixed, **dict(zip(names, values)))
+        for seed in range(seeds):
+            jobs.append((overrides, seed, max_frames, profile))
+    return jobs
+
+
+def aggregate(results, varied_names):
+    """Group results by their varied settings and average each group."""
+    groups = {}
+    for result in results:
+        key = tuple(result['overrides'].get(name) for name in varied_names)
+        groups.setdefault(key, []).append(result)
+    rows = []
+    for key, group in groups.items():
+        rows.append(dict(zip(varied_names, key), **{
+            'runs': len(group),
+            'mean_level': statistics.mean(r['level'] for r in group),
+            'max_level': max(r['level'] for r in group),
+            'mean_score': statistics.mean(r['score'] for r in group),
+            'mean_frames': statistics.mean(r['frames_survived'] for r in group),
+            'game_overs': sum(r['game_over'] for r in group),
+        }))
+    return rows
+
+
+def print_table(rows):
+    """Print rows of dictionaries as an aligned table."""
+    if not rows:
+        return
+    columns = list(rows[0])
+    cells = [[f"{row[column]:.6g}" if isinstance(row[column], float) else str(row[column])
+        for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells))
+        for i, column in enumerate(columns)]
+    print('  '.join(column.rjust(width) for column, width in zip(columns, widths)))
+    for line in cells:
+        print('  '.join(cell.rjust(width) for cell, width in zip(line, widths)))
+
+
+def main():
+    """Run the batch and print the aggregated table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vary', action='append', default=[], metavar='NAME=V1,V2,...')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE')
+    parser.add_argument('--profile', help='settings profile to start every run from')
+    parser.add_argument('--seeds', type=int, default=4)
+    parser.add_argument('--max-frames', type=int, default=60 * 60 * 10)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', help='also write every result to this JSON file')
+    args = parser.parse_args()
+
+    fixed = {}
+    for item in args.set:
+        name, _, value = item.partition('=')
+        fixed[name] = parse_value(value)
+    varied = {}
+    for item in args.vary:
+        name, _, values = item.partition('=')
+        varied[name] = [parse_value(value) for value in values.split(',')]
+
+    jobs = make_jobs(fixed, varied, args.seeds, args.max_frames, args.profile)
+    # Check every combination of settings before starting any workers
+    for overrides, seed, _, profile in jobs:
+        if seed == 0:
+            try:
+                make_settings(overrides, profile)
+            except ProfileError as error:
+                parser.error(str(error))
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(run_simulation, jobs))
+    elapsed = perf_counter() - start
+
+    print_table(aggregate(results, list(varied)))
+    frames = sum(result['frames_survived'] for result in results)
+    print(f"\n{len(jobs)} games, {frames} frames in {elapsed:.1f} s on {args.workers} "
+        f"workers ({frames / elapsed:.0f} frames per second)")
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    # Make the game modules and assets reachable from any working directory
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.getcwd())
+    main()
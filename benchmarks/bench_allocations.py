@@ -0,0 +1,88 @@
+"""Measure memory allocation and GC churn during a long headless session.
+
+Run from the repository root:
+
+    python benchmarks/bench_allocations.py [--frames N] [--max-net-kb KB]
+
+A scripted player fires and sweeps the ship across the screen through
+many levels while tracemalloc records every allocation. With bullets and
+aliens pooled, the live memory should stay flat once the pools have
+warmed up. The script exits with status 1 if the net growth exceeds
+--max-net-kb, so it can be used as a regression check.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# Make the game modules importable when run from the benchmarks folder
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+
+from alien_invasion import AlienInvasion
+
+# Build the scripted events once so the player itself does not allocate
+FIRE = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+GO_RIGHT = [pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT),
+    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)]
+GO_LEFT = [pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT),
+    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)]
+
+
+def player(game, frame):
+    """Fire every few frames and sweep the ship from side to side."""
+    if not game.game_active:
+        game.start_game()
+    if frame % 240 == 0:
+        return GO_RIGHT
+    if frame % 240 == 120:
+        return GO_LEFT
+    if frame % 6 == 0:
+        return FIRE
+    return ()
+
+
+def main():
+    """Warm the pools up, then measure a long session."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--warmup', type=int, default=3000)
+    parser.add_argument('--frames', type=int, default=30000)
+    parser.add_argument('--max-net-kb', type=float, default=128.0)
+    args = parser.parse_args()
+
+    game = AlienInvasion(headless=True, seed=0)
+    # Let the pools fill up before measuring
+    game.simulate(args.warmup, player)
+    gc.collect()
+    collections_before = [gen['collections'] for gen in gc.get_stats()]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    game.simulate(args.frames, player)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    collections = [gen['collections'] - count
+        for gen, count in zip(gc.get_stats(), collections_before)]
+    growth = after.compare_to(before, 'lineno')
+    net_kb = sum(stat.size_diff for stat in growth) / 1024
+    print(f"frames: {args.frames}  level reached: {game.stats.level}")
+    print(f"net live memory growth: {net_kb:.1f} KiB  peak traced: {peak / 1024:.1f} KiB")
+    print(f"GC collections (gen0, gen1, gen2): {collections}")
+    print(f"bullet pool: {game.bullet_pool.stats()}")
+    print(f"alien pool: {game.alien_pool.stats()}")
+    print("top growth:")
+    for stat in growth[:5]:
+        print(f"  {stat}")
+    if net_kb > args.max_net_kb:
+        print(f"FAIL: net growth above {args.max_net_kb} KiB")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
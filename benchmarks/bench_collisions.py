@@ -0,0 +1,82 @@
+"""Compare the grid collision engine with pygame.sprite.groupcollide.
+
+Run from the repository root:
+
+    python benchmarks/bench_collisions.py [--repeat N] [--cell-size PX]
+
+Each scenario scatters bullets and alien-sized sprites over a large
+screen and times both engines on identical copies of the groups.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Make the game modules importable when run from the benchmarks folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import collisions
+
+# Bullet and alien counts for each scenario
+SCENARIOS = [(5, 78), (20, 300), (50, 1000), (100, 3000), (200, 10000)]
+# Size of the simulated screen
+SCREEN_SIZE = (3840, 2160)
+
+
+def make_rects(count, size, rng):
+    """Return count rects of the given size at random screen positions."""
+    return [pygame.Rect(rng.randrange(SCREEN_SIZE[0] - size[0]),
+        rng.randrange(SCREEN_SIZE[1] - size[1]), *size) for _ in range(count)]
+
+
+def make_group(rects):
+    """Return a group of fresh sprites placed at rects."""
+    group = pygame.sprite.Group()
+    for rect in rects:
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rect)
+        group.add(sprite)
+    return group
+
+
+def time_engine(engine, bullet_rects, alien_rects, repeat):
+    """Return the best time in milliseconds and the hit count of engine."""
+    best = float('inf')
+    for _ in range(repeat):
+        # Build new sprites every run, since kill() removes them from all groups
+        bullets, aliens = make_group(bullet_rects), make_group(alien_rects)
+        start = time.perf_counter()
+        hits = engine(bullets, aliens)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, sum(len(hit) for hit in hits.values())
+
+
+def main():
+    """Run every scenario and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--cell-size', type=int, default=64)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'bullets':>8} {'aliens':>8} {'groupcollide ms':>16} {'grid ms':>10} {'speedup':>8}")
+    for bullet_count, alien_count in SCENARIOS:
+        bullets = make_rects(bullet_count, (3, 15), rng)
+        aliens = make_rects(alien_count, (60, 58), rng)
+        pygame_ms, pygame_hits = time_engine(
+            lambda a, b: pygame.sprite.groupcollide(a, b, True, True),
+            bullets, aliens, args.repeat)
+        grid_ms, grid_hits = time_engine(
+            lambda a, b: collisions.groupcollide(a, b, True, True, args.cell_size),
+            bullets, aliens, args.repeat)
+        # Both engines must agree on the number of hits
+        assert pygame_hits == grid_hits, (pygame_hits, grid_hits)
+        print(f"{bullet_count:>8} {alien_count:>8} {pygame_ms:>16.3f} "
+            f"{grid_ms:>10.3f} {pygame_ms / grid_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Compare per-sprite drawing with the renderer's batched atlas blits.
+
+Run from the repository root:
+
+    python benchmarks/bench_draw.py [--repeat N]
+
+Each scenario fills a large headless screen with aliens and bullets and
+times one full redraw of the scene both ways: the per-sprite path blits
+every alien from its own image and calls pygame.draw.rect for every
+bullet, while the atlas path builds the renderer's draw operations and
+issues them with one Surface.blits() call. Both must produce the same
+pixels.
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+# Make the game modules importable when run from the benchmarks folder
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+
+from alien_invasion import AlienInvasion
+from settings import Settings
+
+# Alien and bullet counts for each scenario
+SCENARIOS = [(50, 5), (500, 50), (2000, 200), (5000, 500), (10000, 1000)]
+# Size of the simulated screen
+SCREEN_SIZE = (3840, 2160)
+
+
+def make_game(alien_count, bullet_count):
+    """Return a headless game with alien_count aliens and bullet_count bullets."""
+    settings = Settings()
+    settings.screen_width, settings.screen_height = SCREEN_SIZE
+    settings.bullets_allowed = bullet_count
+    game = AlienInvasion(headless=True, seed=0, settings=settings)
+    game.game_active = True
+    # Spread the aliens and bullets over the screen in overlapping grids
+    columns = SCREEN_SIZE[0] // 30
+    for index in range(alien_count):
+        alien = game.alien_pool.acquire()
+        alien.rect.topleft = (index % columns * 30, index // columns * 10 % SCREEN_SIZE[1])
+        game.aliens.add(alien)
+    for index in range(bullet_count):
+        bullet = game.bullet_pool.acquire()
+        bullet.rect.topleft = (index * 7 % SCREEN_SIZE[0], index * 13 % SCREEN_SIZE[1])
+        game.bullets.add(bullet)
+    return game
+
+
+def draw_per_sprite(game):
+    """Draw the scene one sprite at a time, the way the game used to."""
+    screen = game.screen
+    screen.blit(game.renderer.background, (0, 0))
+    for bullet in game.bullets:
+        bullet.draw_bullet()
+    game.ship.blitme()
+    game.aliens.draw(screen)
+    game.scoreboard.show_score()
+
+
+def draw_atlas(game):
+    """Draw the scene with the renderer's batched atlas blits."""
+    renderer = game.renderer
+    game.screen.blit(renderer.background, (0, 0))
+    renderer._draw(renderer._collect_ops())
+
+
+def time_draw(draw, game, repeat):
+    """Return the best time in milliseconds for one draw, and a hash of its pixels."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        draw(game)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, hashlib.md5(pygame.image.tostring(game.screen, 'RGB')).hexdigest()
+
+
+def main():
+    """Run every scenario and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'aliens':>8} {'bullets':>8} {'per-sprite ms':>14} {'atlas ms':>9} {'speedup':>8}")
+    for alien_count, bullet_count in SCENARIOS:
+        game = make_game(alien_count, bullet_count)
+        sprite_ms, sprite_pixels = time_draw(draw_per_sprite, game, args.repeat)
+        atlas_ms, atlas_pixels = time_draw(draw_atlas, game, args.repeat)
+        # Both paths must draw exactly the same frame
+        assert sprite_pixels == atlas_pixels, 'the atlas path drew a different frame'
+        print(f"{alien_count:>8} {bullet_count:>8} {sprite_ms:>14.3f} "
+            f"{atlas_ms:>9.3f} {sprite_ms / atlas_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
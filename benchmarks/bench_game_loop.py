@@ -0,0 +1,251 @@
+"""Benchmark the core game loop on reproducible scenarios.
+
+Run from the repository root:
+
+    python benchmarks/bench_game_loop.py [--frames N] [--output PATH]
+        [--compare OLD.json] [--tolerance PCT] [--scenario NAME ...]
+        [--profile profiles/NAME.toml] [--snapshot PATH.airs]
+
+Each scenario drives AlienInvasion under SDL's dummy video and audio
+drivers, running events, game logic and rendering with no frame cap. It
+reports frames per second, the per-frame latency distribution, and the
+peak traced memory (measured in a separate pass, since tracemalloc slows
+the game down). It also measures the time to the first frame of a cold
+start in a fresh interpreter. Results are written as JSON, by default to
+benchmarks/results/<commit>.json. With --compare, the run is checked
+against an earlier result file, and the script exits with status 1 if
+any scenario's mean frame time regressed by more than --tolerance
+percent. With --profile, every scenario runs with the settings of that
+profile, such as profiles/large_fleet.toml. With --snapshot, every
+scenario starts from a mid-game state saved by snapshot.py instead of
+its own starting point.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Make the game modules importable when run from the benchmarks folder
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+
+from alien_invasion import AlienInvasion
+from settings import load_profile
+from snapshot import load_snapshot
+
+# Build the scripted events once so the scenarios themselves do not allocate
+FIRE = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+
+def setup_full_fleet(game):
+    """Start a game and let the full first fleet march."""
+    game.start_game()
+
+
+def setup_max_bullets(game):
+    """Start a game that allows many bullets at once."""
+    game.settings.bullets_allowed = 200
+    game.start_game()
+
+
+def setup_late_level(game):
+    """Start a game and jump to level 20 with the matching speeds."""
+    game.start_game()
+    game.stats.level = 20
+    game.settings.apply_level(game.stats.level)
+    game.scoreboard.prep_level()
+
+
+def setup_idle_menu(game):
+    """Leave the game on the Play and difficulty menu."""
+
+
+def fire_every_frame(game, frame):
+    """Press the fire key on every frame."""
+    return [FIRE]
+
+
+def fire_sometimes(game, frame):
+    """Press the fire key every eight frames."""
+    return [FIRE] if frame % 8 == 0 else []
+
+
+def no_input(game, frame):
+    """Do nothing."""
+    return []
+
+
+# Map each scenario name to its setup function and scripted input
+SCENARIOS = {
+    'full_fleet': (setup_full_fleet, fire_sometimes),
+    'max_bullets': (setup_max_bullets, fire_every_frame),
+    'late_levels': (setup_late_level, fire_sometimes),
+    'idle_menu': (setup_idle_menu, no_input),
+}
+
+
+def run_frames(game, inputs, frames, durations=None):
+    """Run events, logic and rendering for frames frames."""
+    for frame in range(frames):
+        start = time.perf_counter_ns()
+        game._check_events()
+        for event in inputs(game, frame):
+            game._handle_event(event)
+        game._update_game()
+        game._update_screen()
+        if durations is not None:
+            durations.append(time.perf_counter_ns() - start)
+
+
+def percentile(ordered, percent):
+    """Return the nearest-rank percentile of a sorted list."""
+    return ordered[max(0, -(-len(ordered) * percent // 100) - 1)]
+
+
+def make_game(profile):
+    """Return a headless game using the settings profile, if one is given."""
+    settings = load_profile(profile) if profile else None
+    return AlienInvasion(headless=True, seed=0, settings=settings)
+
+
+def run_scenario(name, frames, warmup, profile=None, snapshot=None):
+    """Time one scenario and measure its peak memory."""
+    setup, inputs = SCENARIOS[name]
+
+    # Time the scenario without tracing allocations
+    game = make_game(profile)
+    setup(game)
+    if snapshot:
+        load_snapshot(game, snapshot)
+    run_frames(game, inputs, warmup)
+    durations = []
+    start = time.perf_counter()
+    run_frames(game, inputs, frames, durations)
+    elapsed = time.perf_counter() - start
+
+    # Measure peak memory on a fresh game in a separate, traced pass
+    tracemalloc.start()
+    game = make_game(profile)
+    setup(game)
+    if snapshot:
+        load_snapshot(game, snapshot)
+    run_frames(game, inputs, warmup + min(frames, 600))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ordered = sorted(durations)
+    return {
+        'frames': frames,
+        'fps': frames / elapsed,
+        'mean_ms': sum(ordered) / len(ordered) / 1e6,
+        'p50_ms': percentile(ordered, 50) / 1e6,
+        'p95_ms': percentile(ordered, 95) / 1e6,
+        'p99_ms': percentile(ordered, 99) / 1e6,
+        'max_ms': ordered[-1] / 1e6,
+        'peak_memory_kib': peak / 1024,
+        'aliens': len(game.aliens),
+        'bullets': len(game.bullets),
+    }
+
+
+# Script run in a fresh interpreter to time a cold start
+STARTUP_SCRIPT = (
+    "from alien_invasion import AlienInvasion\n"
+    "game = AlienInvasion(headless=True)\n"
+    "game._update_screen()\n"
+    "print(game.time_to_first_frame)\n"
+)
+
+
+def measure_time_to_first_frame(runs=5):
+    """Return the median cold-start time to the first frame in milliseconds."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT],
+            capture_output=True, text=True, check=True).stdout
+        times.append(float(output.split()[-1]) * 1000)
+    return sorted(times)[len(times) // 2]
+
+
+def git_commit():
+    """Return the short hash of the current commit, or 'unknown'."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results, baseline_path, tolerance):
+    """Print the change against a baseline file; return True on regression."""
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    regressed = False
+    print(f"\ncompared with {baseline.get('commit', baseline_path)}:")
+    for name, stats in results['scenarios'].items():
+        old = baseline['scenarios'].get(name)
+        if old is None:
+            continue
+        change = (stats['mean_ms'] - old['mean_ms']) / old['mean_ms'] * 100
+        flag = ''
+        if change > tolerance:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f"  {name:<12} mean {old['mean_ms']:.3f} -> {stats['mean_ms']:.3f} ms "
+            f"({change:+.1f}%){flag}")
+    return regressed
+
+
+def main():
+    """Run the selected scenarios and store the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=1200)
+    parser.add_argument('--warmup', type=int, default=120)
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS))
+    parser.add_argument('--output')
+    parser.add_argument('--compare')
+    parser.add_argument('--tolerance', type=float, default=10.0)
+    parser.add_argument('--profile', help='settings profile to run every scenario with')
+    parser.add_argument('--snapshot', help='saved game to start every scenario from')
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'profile': args.profile,
+        'snapshot': args.snapshot,
+        'time_to_first_frame_ms': measure_time_to_first_frame(),
+        'scenarios': {},
+    }
+    print(f"time to first frame: {results['time_to_first_frame_ms']:.1f} ms\n")
+    print(f"{'scenario':<12} {'fps':>9} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'peak KiB':>9}")
+    for name in args.scenario or SCENARIOS:
+        stats = run_scenario(name, args.frames, args.warmup, args.profile, args.snapshot)
+        results['scenarios'][name] = stats
+        print(f"{name:<12} {stats['fps']:>9.0f} {stats['mean_ms']:>8.3f} {stats['p50_ms']:>8.3f} "
+            f"{stats['p95_ms']:>8.3f} {stats['p99_ms']:>8.3f} {stats['max_ms']:>8.3f} "
+            f"{stats['peak_memory_kib']:>9.0f}")
+
+    output = args.output or os.path.join('benchmarks', 'results', f'{commit}.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"\nresults written to {output}")
+
+    if args.compare and compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Soak-test the engine with the endless swarm over a long session.
+
+Run from the repository root:
+
+    python benchmarks/bench_soak.py [--minutes N] [--report-every SECONDS]
+        [--profile profiles/NAME.toml] [--render] [--trace-memory]
+        [--max-growth-kb KB]
+
+The game runs headless in endless mode with an invincible ship, so the
+swarm is never wiped by a ship hit and grows towards swarm_max_aliens;
+aliens that reach the bottom are recycled instead. A simple AI player
+chases the lowest alien and fires. Every --report-every seconds of game
+time the script prints the live alien and bullet counts, the most aliens
+alive at once, the frame time percentiles over that stretch, the aliens
+destroyed per second and the memory in use: the peak resident set size,
+or with --trace-memory the live memory traced by tracemalloc, which is
+exact but slows every frame down. After the first report the memory
+should stay flat; the script exits with status 1 if it grows by more than
+--max-growth-kb by the end. --minutes is game time, so a multi-hour soak
+runs as fast as the machine allows.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Import resource to read the peak memory use where it exists (Unix)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Make the game modules importable when run from the benchmarks folder
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from alien_invasion import AlienInvasion
+from batch_runner import SimplePlayer
+from settings import Settings, load_profile
+
+
+def make_game(profile):
+    """Return a headless endless-mode game whose ship cannot be hit."""
+    settings = load_profile(profile) if profile else Settings()
+    settings.game_mode = 'endless'
+    settings.invincible = True
+    settings.profile = True
+    game = AlienInvasion(headless=True, seed=0, settings=settings)
+    game.start_game()
+    return game
+
+
+def memory_kib(trace):
+    """Return the traced live memory, or the peak resident set size, in KiB."""
+    if trace:
+        return tracemalloc.get_traced_memory()[0] / 1024
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kibibytes
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+def main():
+    """Run the soak session and print a report line at every interval."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', type=float, default=10.0)
+    parser.add_argument('--report-every', type=float, default=60.0)
+    parser.add_argument('--profile', help='settings profile to start from')
+    parser.add_argument('--render', action='store_true', help='also draw every frame')
+    parser.add_argument('--trace-memory', action='store_true',
+        help='measure live memory with tracemalloc (slower)')
+    parser.add_argument('--max-growth-kb', type=float, default=1024.0)
+    args = parser.parse_args()
+
+    game = make_game(args.profile)
+    player = SimplePlayer()
+    profiler = game.profiler
+    frames_per_report = round(args.report_every / game.settings.timestep)
+    reports = max(1, round(args.minutes * 60 / args.report_every))
+
+    if args.trace_memory:
+        tracemalloc.start()
+    baseline = None
+    peak = 0
+    print(f"{'minute':>7} {'aliens':>7} {'peak':>6} {'bullets':>8} {'p50 ms':>7} "
+        f"{'p99 ms':>7} {'kills/s':>8} {'waves':>6} {'memory KiB':>11}")
+    for report in range(1, reports + 1):
+        score = game.stats.score
+        profiler.samples.clear()
+        for _ in range(frames_per_report):
+            start = time.perf_counter_ns()
+            for event in player(game, game.frame_count):
+                game._handle_event(event)
+            game._update_game()
+            if args.render:
+                game._update_screen()
+            profiler.record('frame', time.perf_counter_ns() - start)
+            peak = max(peak, len(game.aliens))
+        frame = profiler.summary()['frame']
+        kills = (game.stats.score - score) / game.settings.alien_points
+        memory = memory_kib(args.trace_memory)
+        # Measure growth from the end of the first interval, once the pools are warm
+        if baseline is None:
+            baseline = memory
+        print(f"{report * args.report_every / 60:>7.1f} {profiler.counters['aliens']:>7} "
+            f"{peak:>6} {profiler.counters['bullets']:>8} {frame['p50_ms']:>7.3f} "
+            f"{frame['p99_ms']:>7.3f} {kills / args.report_every:>8.1f} "
+            f"{game.swarm.waves_spawned:>6} {memory:>11.0f}")
+    if args.trace_memory:
+        tracemalloc.stop()
+
+    growth = memory - baseline
+    print(f"\npeak live aliens: {peak} (swarm_max_aliens {game.settings.swarm_max_aliens})")
+    print(f"memory growth after warmup: {growth:.1f} KiB")
+    print(f"alien pool: {game.alien_pool.stats()}")
+    print(f"bullet pool: {game.bullet_pool.stats()}")
+    print(f"alien bullet pool: {game.alien_bullet_pool.stats()}")
+    if growth > args.max_growth_kb:
+        print(f"FAIL: memory grew by more than {args.max_growth_kb} KiB")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
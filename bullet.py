@@ -10,22 +10,35 @@ class Bullet(Sprite):
         self.screen = ai_game.screen
         self.settings = ai_game.settings
         self.color = self.settings.bullet_color
+        self.ship = ai_game.ship
+        self.pool = ai_game.bullet_pool
 
         # Create a bullet rect at (0, 0) and then set correct position.
         self.rect = pygame.Rect(0, 0, self.settings.bullet_width,
             self.settings.bullet_height)
-        self.rect.midtop = ai_game.ship.rect.midtop
+        self.reset()
 
+    def reset(self):
+        """Move the bullet back to the ship's current position."""
+        self.rect.midtop = self.ship.rect.midtop
         #store the bullet's position as a decimal value.
         self.y = float(self.rect.y)
-    
-    def update(self):
-        """Move the bullet up the screen."""
+
+    def recycle(self):
+        """Remove the bullet from its groups and return it to the pool."""
+        self.kill()
+        self.pool.release(self)
+
+    def update(self, scale=1.0):
+        """Move the bullet up the screen, recycling it once it leaves."""
         # Update the decimal position of the bullet.
-        self.y -= self.settings.bullet_speed
+        self.y -= self.settings.bullet_speed * scale
         # Update the rect position.
         self.rect.y = self.y
-    
+        # Get rid of the bullet once it has gone off the top of the screen.
+        if self.rect.bottom <= 0:
+            self.recycle()
+
     def draw_bullet(self):
         """Draw the bullet to the screen."""
         pygame.draw.rect(self.screen, self.color, self.rect)
\ No newline at end of file
@@ -7,6 +7,8 @@ class Button:
         """Initialize button attributes."""
         # Store the game screen for later use
         self.screen = ai_game.screen
+        # Use the game's shared cache of rendered text
+        self.text_cache = ai_game.text_cache
         # Get the rectangle of the screen to position the button
         self.screen_rect = self.screen.get_rect()
         # Set button width and height
@@ -33,7 +35,7 @@ class Button:
     def _prep_msg(self, msg):
         """Turn msg into a rendered image and center text on the button."""
         # Create an image of the text
-        self.msg_image = self.font.render(msg, True, self.text_color, self.play_button_color)
+        self.msg_image = self.text_cache.render(self.font, msg, self.text_color, self.play_button_color)
         # Get the rectangle of the text image
         self.msg_image_rect = self.msg_image.get_rect()
         # Center the text image on the button
@@ -60,25 +62,44 @@ class Button:
             # Add the button and its difficulty to the list
             self.difficulty_buttons.append((button, difficulty))
 
-    def draw_button(self):
-        # Draw the button rectangle on the screen
-        self.screen.fill(self.play_button_color, self.rect)
-        # Draw the text on the button
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+    def draw_ops(self, ai_game):
+        """Return the (color or image, rect) pairs that draw all the buttons."""
+        # Draw the Play button, then each difficulty button
+        return self._play_ops() + self._difficulty_ops(ai_game)
 
-    def draw_difficulty_buttons(self, ai_game):
-        """Draw the difficulty buttons."""
+    def _play_ops(self):
+        """Return the draw operations for the Play button."""
+        # Fill the button rectangle, then draw the text on it
+        return [(self.play_button_color, self.rect), (self.msg_image, self.msg_image_rect)]
+
+    def _difficulty_ops(self, ai_game):
+        """Return the draw operations for the difficulty buttons."""
+        ops = []
         # Iterate through each difficulty button
         for button, difficulty in self.difficulty_buttons:
             # Set the color based on whether it's the current difficulty
             color = self.difficulty_button_color if ai_game.settings.difficulty != difficulty.lower() else (100, 100, 255)
-            # Draw the button rectangle
-            self.screen.fill(color, button)
-            # Render the difficulty text
-            msg_image = self.font.render(difficulty, True, self.text_color, color)
-            # Get the rectangle of the text image
-            msg_image_rect = msg_image.get_rect()
+            # Render the difficulty text, reusing a cached image if possible
+            msg_image = self.text_cache.render(self.font, difficulty, self.text_color, color)
             # Center the text on the button
-            msg_image_rect.center = button.center
-            # Draw the text on the button
-            self.screen.blit(msg_image, msg_image_rect)
\ No newline at end of file
+            msg_image_rect = msg_image.get_rect(center=button.center)
+            # Fill the button rectangle, then draw the text on it
+            ops.append((color, button))
+            ops.append((msg_image, msg_image_rect))
+        return ops
+
+    def draw_button(self):
+        """Draw the Play button."""
+        self._draw_ops(self._play_ops())
+
+    def draw_difficulty_buttons(self, ai_game):
+        """Draw the difficulty buttons."""
+        self._draw_ops(self._difficulty_ops(ai_game))
+
+    def _draw_ops(self, ops):
+        """Draw the color operations as rects and blit the image operations."""
+        for source, rect in ops:
+            if isinstance(source, pygame.Surface):
+                self.screen.blit(source, rect)
+            else:
+                pygame.draw.rect(self.screen, source, rect)
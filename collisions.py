@@ -0,0 +1,110 @@
+class CollisionGrid:
+    """A uniform grid (spatial hash) indexing the rects of a sprite group.
+
+    Each query only tests the sprites sharing a cell with the queried
+    rect instead of every sprite in the group, and returns results with
+    the semantics of pygame.sprite.groupcollide and spritecollideany.
+    """
+
+    def __init__(self, cell_size=64):
+        """Initialize an empty grid with square cells of cell_size pixels."""
+        # Store the width and height of each cell in pixels
+        self.cell_size = cell_size
+        # Map each (column, row) cell to the sprites whose top-left is in it
+        self.cells = {}
+        # Track the largest indexed rect so queries know how far to look
+        self.max_width = self.max_height = 0
+        # Keep the indexed group so killed sprites can be skipped
+        self.group = None
+        # Keep the indexed sprites in group order to sort multiple hits
+        self.sprites = []
+        self._order = None
+
+    def build(self, group):
+        """Index every sprite of group by the cell holding its top-left corner."""
+        # Start from an empty grid
+        cells = self.cells = {}
+        self.group = group
+        self.sprites = group.sprites()
+        self._order = None
+        size = self.cell_size
+        max_width = max_height = 0
+        # Add each sprite to exactly one cell, keyed by its top-left corner
+        for sprite in self.sprites:
+            rect = sprite.rect
+            key = (rect.x // size, rect.y // size)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+            # Remember the largest size so queries can reach far enough
+            if rect.width > max_width:
+                max_width = rect.width
+            if rect.height > max_height:
+                max_height = rect.height
+        self.max_width, self.max_height = max_width, max_height
+
+    def query(self, rect):
+        """Return the indexed sprites still in the group that collide with rect."""
+        # Look in every cell that could hold the top-left of an overlapping rect
+        cells = self.cells
+        size = self.cell_size
+        candidates = []
+        for column in range((rect.left - self.max_width) // size, (rect.right - 1) // size + 1):
+            for row in range((rect.top - self.max_height) // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get((column, row))
+                if bucket:
+                    candidates.extend(bucket)
+        # Keep only live candidates whose rect really overlaps
+        if not candidates:
+            return []
+        group = self.group
+        hits = [sprite for sprite in candidates
+            if rect.colliderect(sprite.rect) and group.has(sprite)]
+        # Report the hits in group order, like pygame does
+        if len(hits) > 1:
+            if self._order is None:
+                self._order = {sprite: index for index, sprite in enumerate(self.sprites)}
+            hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def collide_any(self, sprite):
+        """Return one indexed sprite colliding with sprite, or None."""
+        hits = self.query(sprite.rect)
+        return hits[0] if hits else None
+
+    def collide_group(self, groupa, dokilla, dokillb):
+        """Find collisions between groupa and the indexed group.
+
+        Returns a dictionary mapping each sprite of groupa to the list of
+        indexed sprites it hit, killing sprites as groupcollide() would.
+        """
+        crashed = {}
+        # Test each sprite of groupa against its neighbouring cells only
+        for sprite in groupa.sprites():
+            hits = self.query(sprite.rect)
+            if not hits:
+                continue
+            # Remove the hit sprites at once so later sprites cannot hit them
+            if dokillb:
+                for hit in hits:
+                    hit.kill()
+            crashed[sprite] = hits
+            if dokilla:
+                sprite.kill()
+        return crashed
+
+
+def groupcollide(groupa, groupb, dokilla, dokillb, cell_size=64):
+    """Drop-in replacement for pygame.sprite.groupcollide using a grid."""
+    grid = CollisionGrid(cell_size)
+    grid.build(groupb)
+    return grid.collide_group(groupa, dokilla, dokillb)
+
+
+def spritecollideany(sprite, group, cell_size=64):
+    """Drop-in replacement for pygame.sprite.spritecollideany using a grid."""
+    grid = CollisionGrid(cell_size)
+    grid.build(group)
+    return grid.collide_any(sprite)
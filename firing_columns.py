@@ -0,0 +1,94 @@
+class FiringColumns:
+    """A class to track the lowest living alien in each column of aliens.
+
+    Aliens are grouped by the x position they were placed at, and each
+    column is kept in order from top to bottom, so its lowest alien, the
+    only one with a clear shot at the ship, is always the last one.
+    Removing a destroyed alien updates its column in place, so choosing
+    a shooter never has to scan the fleet. The aliens all move sideways
+    together, so the columns stay exact until aliens that have not moved
+    with them are added; rebuild() then regroups them all by where they
+    stand.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of columns."""
+        # Map each column's x position to its aliens, top to bottom
+        self.columns = {}
+        # Map each alien to the x position of its column
+        self.column_of = {}
+        # Keep a list of the column keys for random choice, rebuilt as needed
+        self._keys = None
+
+    def clear(self):
+        """Forget every alien."""
+        self.columns.clear()
+        self.column_of.clear()
+        self._keys = None
+
+    def add(self, aliens):
+        """Add aliens to the columns they are standing in."""
+        for alien in aliens:
+            key = alien.rect.x
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = []
+                self._keys = None
+            self._insert(column, alien)
+            self.column_of[alien] = key
+
+    def rebuild(self, aliens):
+        """Regroup every alien into columns by its current x position."""
+        self.clear()
+        # Sorting top to bottom once fills each column in order
+        for alien in sorted(aliens, key=lambda alien: alien.rect.y):
+            key = alien.rect.x
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = []
+            column.append(alien)
+            self.column_of[alien] = key
+
+    def restore(self, keys, aliens, alien_keys):
+        """Rebuild saved columns, given in order, from each alien's column key."""
+        self.clear()
+        # Recreate the columns in their saved order, so random picks repeat
+        for key in keys:
+            self.columns[key] = []
+        for alien, key in zip(aliens, alien_keys):
+            self._insert(self.columns[key], alien)
+            self.column_of[alien] = key
+
+    def _insert(self, column, alien):
+        """Insert alien into column, keeping it in order from top to bottom."""
+        # Insert above the first alien lower than this one; the fleet
+        # moves as a whole, so the order never changes afterwards
+        y = alien.rect.y
+        index = 0
+        while index < len(column) and column[index].rect.y < y:
+            index += 1
+        column.insert(index, alien)
+
+    def remove(self, alien):
+        """Remove a destroyed alien from its column."""
+        key = self.column_of.pop(alien, None)
+        if key is None:
+            return
+        column = self.columns[key]
+        # The lowest alien is the one most often shot, and the cheapest to drop
+        if column[-1] is alien:
+            column.pop()
+        else:
+            column.remove(alien)
+        # Drop the column once it is empty
+        if not column:
+            del self.columns[key]
+            self._keys = None
+
+    def pick_shooter(self, rng):
+        """Return the lowest alien of a random column, or None if there are none."""
+        if not self.columns:
+            return None
+        if self._keys is None:
+            self._keys = list(self.columns)
+        return self.columns[rng.choice(self._keys)][-1]
@@ -0,0 +1,112 @@
+# Import lru_cache to compute each fleet layout only once
+from functools import lru_cache
+
+# Import NumPy if it is installed; the array fleet is optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@lru_cache(maxsize=None)
+def fleet_layout(screen_width, screen_height, alien_width, alien_height):
+    """Return the (x, y) starting position of every alien in a fleet.
+
+    The layout depends only on the screen and alien sizes, so it is
+    computed once per combination and reused for every new fleet.
+    """
+    positions = []
+    # Create rows of aliens until 3 alien heights from screen bottom
+    for y in range(alien_height, screen_height - 5 * alien_height, 2 * alien_height):
+        # Place the aliens in a row 2 widths apart horizontally
+        for x in range(alien_width, screen_width - 2 * alien_width, 2 * alien_width):
+            positions.append((x, y))
+    return tuple(positions)
+
+
+class ArrayFleet:
+    """A structure-of-arrays backend that moves the alien fleet with NumPy.
+
+    The x/y positions and alive flags of every alien live in NumPy arrays,
+    so movement, edge, drop and bottom checks are each one vectorized
+    operation. The Alien sprites are kept for drawing and collisions; their
+    rects are synced from the arrays once per frame.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize an empty fleet."""
+        # Fail early with a clear message if NumPy is not installed
+        if np is None:
+            raise ImportError("The 'numpy' fleet backend requires NumPy.")
+        # Store the game settings and screen rectangle for later use
+        self.settings = ai_game.settings
+        self.screen_rect = ai_game.screen.get_rect()
+        # Remember the last restored layout as an array
+        self._layout = None
+        self._positions = None
+        # Start with no aliens
+        self.bind([])
+
+    def bind(self, aliens):
+        """Load the positions of the aliens into the fleet arrays."""
+        # Keep the sprites in array order so rects can be synced
+        self.sprites = list(aliens)
+        # Tell each alien where its data lives in the arrays
+        for index, alien in enumerate(self.sprites):
+            alien.fleet_index = index
+        # Store exact horizontal positions, rect positions and sizes
+        self.x = np.array([alien.x for alien in self.sprites], dtype=float)
+        self.rect_x = np.array([alien.rect.x for alien in self.sprites], dtype=int)
+        self.rect_y = np.array([alien.rect.y for alien in self.sprites], dtype=int)
+        self.width = np.array([alien.rect.width for alien in self.sprites], dtype=int)
+        self.height = np.array([alien.rect.height for alien in self.sprites], dtype=int)
+        # Every alien starts alive
+        self.alive = np.ones(len(self.sprites), dtype=bool)
+
+    def restore(self, layout):
+        """Put the bound aliens back at the layout positions, all alive."""
+        # Convert the layout to an array only the first time it is used
+        if layout is not self._layout:
+            self._layout = layout
+            self._positions = np.array(layout, dtype=int).reshape(-1, 2)
+        positions = self._positions
+        # Copy the layout into the arrays in bulk
+        self.x[:] = positions[:, 0]
+        self.rect_x[:] = positions[:, 0]
+        self.rect_y[:] = positions[:, 1]
+        self.alive[:] = True
+        self._sync_rects()
+
+    def remove(self, aliens):
+        """Mark the given aliens as dead."""
+        for alien in aliens:
+            self.alive[alien.fleet_index] = False
+
+    def at_edge(self):
+        """Return True if any living alien is at an edge of the screen."""
+        return bool(np.any(self.alive & (
+            (self.rect_x + self.width >= self.screen_rect.right) | (self.rect_x <= 0))))
+
+    def drop(self, distance):
+        """Move the whole fleet down by distance pixels."""
+        self.rect_y += distance
+        self._sync_rects()
+
+    def reached_bottom(self):
+        """Return True if any living alien has reached the bottom of the screen."""
+        return bool(np.any(self.alive & (self.rect_y + self.height >= self.screen_rect.bottom)))
+
+    def update(self, scale=1.0):
+        """Move the fleet to the right or left."""
+        # Move every alien by the fleet speed in the current direction
+        self.x += self.settings.alien_speed * self.settings.fleet_direction * scale
+        # Round half away from zero, the way pygame stores floats in a Rect
+        self.rect_x = np.trunc(self.x + np.copysign(0.5, self.x)).astype(int)
+        self._sync_rects()
+
+    def _sync_rects(self):
+        """Copy the array positions back into the sprites for drawing."""
+        for alien, x, rect_x, rect_y in zip(self.sprites, self.x.tolist(),
+                self.rect_x.tolist(), self.rect_y.tolist()):
+            alien.x = x
+            alien.rect.topleft = (rect_x, rect_y)
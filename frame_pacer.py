@@ -0,0 +1,56 @@
+import pygame
+
+class FramePacer:
+    """A class to pace the main loop and let it sleep while nothing moves."""
+
+    def __init__(self, ai_game):
+        """Initialize the pacer with the game's frame-rate settings."""
+        # Store the game settings for the target frame rate and timeouts
+        self.settings = ai_game.settings
+        # Create a clock to cap the frame rate and measure frame times
+        self.clock = pygame.time.Clock()
+        # Note whether the last frame started after sleeping in idle mode
+        self.woke_from_idle = False
+        # Note whether the display actually synchronizes with the monitor
+        self.vsync = False
+
+    def set_mode(self, size):
+        """Open the game window, with VSync if requested and available."""
+        if self.settings.vsync:
+            try:
+                # SDL only offers VSync through its renderer, used by SCALED
+                screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                self.vsync = True
+                return screen
+            except pygame.error:
+                # Fall back to a normal window paced by the clock alone
+                pass
+        return pygame.display.set_mode(size)
+
+    def frame_time(self):
+        """Return the seconds the game should advance for this frame."""
+        # A frame after an idle sleep did not animate anything, so the
+        # time spent asleep must not move the game
+        if self.woke_from_idle:
+            return 0.0
+        # Limit the time so a stall does not move everything a long way at once
+        return min(self.clock.get_time() / 1000, self.settings.max_frame_time)
+
+    def wait_for_event(self):
+        """Sleep until an event arrives or the idle timeout passes.
+
+        Returns the event, or None on timeout. The game calls this instead
+        of running frames when nothing on screen is moving, so the process
+        uses no CPU between inputs, yet still responds to them at once.
+        """
+        event = pygame.event.wait(int(self.settings.idle_timeout * 1000))
+        # Restart the frame clock so the next frame time excludes the sleep
+        self.clock.tick()
+        self.woke_from_idle = True
+        return None if event.type == pygame.NOEVENT else event
+
+    def tick(self):
+        """End the frame, waiting as needed to hold the target frame rate."""
+        self.woke_from_idle = False
+        # A target of 0 leaves the frame rate uncapped
+        self.clock.tick(self.settings.target_fps)
@@ -0,0 +1,33 @@
+class SpritePool:
+    """A free list of sprites that are recycled instead of reallocated."""
+
+    def __init__(self, factory):
+        """Initialize an empty pool that creates new sprites with factory()."""
+        # Store the function used to build a sprite when the pool is empty
+        self.factory = factory
+        # Keep the sprites that are free to be reused
+        self.free = []
+        # Count how many sprites were built and how many were reused
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self):
+        """Return a free sprite, building a new one only if none is left."""
+        if self.free:
+            self.reused += 1
+            return self.free.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, sprite):
+        """Give a sprite back to the pool."""
+        self.free.append(sprite)
+
+    def release_group(self, group):
+        """Give every sprite of group back to the pool and empty the group."""
+        self.free.extend(group.sprites())
+        group.empty()
+
+    def stats(self):
+        """Return the pool counters as a dictionary."""
+        return {'created': self.created, 'reused': self.reused, 'free': len(self.free)}
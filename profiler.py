@@ -0,0 +1,125 @@
+# Import modules for timing, rolling windows and exporting results
+import csv
+import json
+from collections import deque
+from time import perf_counter_ns
+
+# Import the pygame.font module to render the overlay text
+import pygame.font
+
+class FrameProfiler:
+    """A class to time each phase of a frame and report rolling percentiles.
+
+    When the profiler is disabled, run() just calls the phase, so leaving
+    the instrumentation in the main loop costs almost nothing.
+    """
+
+    def __init__(self, ai_game, window=600):
+        """Initialize the profiler, keeping the last window samples per phase."""
+        # Store the game settings for later use
+        self.settings = ai_game.settings
+        # Start measuring right away only if the settings ask for it
+        self.enabled = self.settings.profile
+        # Keep the overlay hidden until it is toggled on
+        self.overlay_visible = False
+        # Store how many samples each phase keeps
+        self.window = window
+        # Map each phase name to its most recent durations in nanoseconds
+        self.samples = {}
+        # Map each counter name, such as live aliens, to its latest value
+        self.counters = {}
+        # Cache the overlay images, refreshed a few times per second
+        self._font = None
+        self._overlay_ops = []
+        self._frames_since_refresh = 0
+
+    def run(self, name, func, *args):
+        """Call func(*args), timing it as phase name if profiling is on."""
+        if not self.enabled:
+            return func(*args)
+        start = perf_counter_ns()
+        result = func(*args)
+        self.record(name, perf_counter_ns() - start)
+        return result
+
+    def record(self, name, duration_ns):
+        """Add one duration in nanoseconds to the samples of phase name."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(duration_ns)
+
+    def set_counter(self, name, value):
+        """Store the latest value of counter name."""
+        self.counters[name] = value
+
+    def toggle_overlay(self):
+        """Show or hide the overlay, turning profiling on when it is shown."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+            self._frames_since_refresh = None
+
+    def summary(self):
+        """Return count, mean, p50, p95, p99 and max in milliseconds per phase."""
+        summary = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            count = len(ordered)
+            summary[name] = {
+                'count': count,
+                'mean_ms': sum(ordered) / count / 1e6,
+                'p50_ms': self._percentile(ordered, 50) / 1e6,
+                'p95_ms': self._percentile(ordered, 95) / 1e6,
+                'p99_ms': self._percentile(ordered, 99) / 1e6,
+                'max_ms': ordered[-1] / 1e6,
+            }
+        return summary
+
+    def _percentile(self, ordered, percent):
+        """Return the nearest-rank percentile of a sorted list."""
+        index = max(0, -(-len(ordered) * percent // 100) - 1)
+        return ordered[index]
+
+    def export(self, path):
+        """Write the summary to path as JSON or, for a .csv path, as CSV."""
+        summary = self.summary()
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['phase', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+                for name, stats in summary.items():
+                    writer.writerow([name] + list(stats.values()))
+        else:
+            with open(path, 'w') as file:
+                json.dump(summary, file, indent=2)
+
+    def overlay_ops(self):
+        """Return the (image, rect) pairs that draw the overlay."""
+        if not self.overlay_visible:
+            return []
+        # Re-render the text only every 30 frames to keep the overlay cheap
+        if self._frames_since_refresh is None or self._frames_since_refresh >= 30:
+            self._refresh_overlay()
+        else:
+            self._frames_since_refresh += 1
+        return self._overlay_ops
+
+    def _refresh_overlay(self):
+        """Render one line of percentiles per phase."""
+        if self._font is None:
+            self._font = pygame.font.SysFont(None, 22)
+        self._overlay_ops = []
+        top = 70
+        for name, stats in self.summary().items():
+            line = (f"{name:<10} p50 {stats['p50_ms']:6.2f}  p95 {stats['p95_ms']:6.2f}"
+                f"  p99 {stats['p99_ms']:6.2f} ms")
+            image = self._font.render(line, True, (30, 30, 30), self.settings.bg_color)
+            self._overlay_ops.append((image, image.get_rect(left=10, top=top)))
+            top += image.get_height() + 2
+        # Show the counters on one line below the timings
+        if self.counters:
+            line = '  '.join(f"{name} {value}" for name, value in self.counters.items())
+            image = self._font.render(line, True, (30, 30, 30), self.settings.bg_color)
+            self._overlay_ops.append((image, image.get_rect(left=10, top=top)))
+        self._frames_since_refresh = 0
@@ -0,0 +1,113 @@
+# Import groupby to batch runs of blits, and the pygame module
+from itertools import groupby
+import pygame
+
+class Renderer:
+    """A class to draw the game, updating only the parts that changed.
+
+    Every frame the renderer gathers draw operations, each an image or
+    fill color, a rect and an optional source area, from the bullets,
+    ship, aliens, HUD and buttons. The bullets, ship and aliens are all
+    drawn from one sprite atlas, so the scene goes to the screen in a
+    single Surface.blits() call. With dirty rendering on, it erases only
+    the rects drawn last frame, redraws the scene and passes just those
+    regions to pygame.display.update(). If nothing changed it does no
+    work at all.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize the renderer."""
+        # Store the game and its screen for later use
+        self.ai_game = ai_game
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        # Find the ship, alien and bullet images in the game's sprite atlas
+        self.atlas = ai_game.atlas.surface
+        self.ship_area = ai_game.atlas.area('ship')
+        self.alien_area = ai_game.atlas.area('alien')
+        self.bullet_area = ai_game.atlas.area('bullet')
+        self.alien_bullet_area = ai_game.atlas.area('alien_bullet')
+        # Keep a background surface to erase old sprites with, like RenderUpdates
+        self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill(self.settings.bg_color)
+        # Remember what was drawn last frame
+        self._last_ops = None
+        # Force a full redraw on the first frame
+        self._full_redraw = True
+
+    def invalidate(self):
+        """Force the next frame to redraw the whole screen."""
+        self._full_redraw = True
+
+    def render(self):
+        """Draw the current frame and update the display."""
+        # Gather everything that must be drawn this frame
+        ops = self._collect_ops()
+        # Redraw and flip the whole screen if dirty rendering is off
+        if not self.settings.dirty_rendering or self._full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            self._draw(ops)
+            pygame.display.flip()
+            self._full_redraw = False
+        # Skip the frame entirely if nothing changed since the last one
+        elif ops != self._last_ops:
+            # Erase everything drawn last frame by copying the background over it
+            # (clipped first, since off-screen areas would shift the copied region)
+            background = self.background
+            screen_rect = self.screen.get_rect()
+            self.screen.blits([(background, clipped, clipped) for clipped in
+                (op[1].clip(screen_rect) for op in self._last_ops)], doreturn=False)
+            # Redraw the scene and update only the erased and drawn regions
+            self._draw(ops)
+            pygame.display.update([op[1] for op in self._last_ops] + [op[1] for op in ops])
+        # Remember this frame to compare it with the next one
+        self._last_ops = ops
+
+    def _collect_ops(self):
+        """Return this frame's (image or color, rect, area) draw operations."""
+        ai_game = self.ai_game
+        atlas = self.atlas
+        # Copy each rect so later movement cannot change the recorded frame
+        Rect = pygame.Rect
+        # Draw the bullets first, then the ship and the aliens, all from the atlas
+        bullet_area = self.bullet_area
+        ops = [(atlas, Rect(bullet.rect), bullet_area) for bullet in ai_game.bullets]
+        alien_bullet_area = self.alien_bullet_area
+        ops.extend((atlas, Rect(bullet.rect), alien_bullet_area)
+            for bullet in ai_game.alien_bullets)
+        ops.append((atlas, Rect(ai_game.ship.rect), self.ship_area))
+        ops.extend(self._alien_ops())
+        # Draw the scoreboard on top of the game
+        ops.extend((image, Rect(rect), None) for image, rect in ai_game.scoreboard.draw_ops())
+        # Draw the buttons if the game is not active
+        if not ai_game.game_active:
+            ops.extend((source, Rect(rect), None)
+                for source, rect in ai_game.play_button.draw_ops(ai_game))
+        # Draw the profiler overlay last, if it is shown
+        ops.extend((image, Rect(rect), None) for image, rect in ai_game.profiler.overlay_ops())
+        return ops
+
+    def _alien_ops(self):
+        """Return the draw operations for the aliens."""
+        atlas, area = self.atlas, self.alien_area
+        width, height = area.size
+        fleet = self.ai_game.array_fleet
+        # Read the positions straight from the NumPy fleet arrays if it is used
+        if fleet is not None:
+            alive = fleet.alive
+            return [(atlas, pygame.Rect(x, y, width, height), area) for x, y in
+                zip(fleet.rect_x[alive].tolist(), fleet.rect_y[alive].tolist())]
+        return [(atlas, pygame.Rect(alien.rect), area) for alien in self.ai_game.aliens]
+
+    def _draw(self, ops):
+        """Carry out the draw operations on the screen."""
+        screen = self.screen
+        # Blit each run of images with one call, and draw rects of a plain
+        # color (draw.rect clips rects that stick out of the screen, which
+        # fill() does not)
+        for is_image, run in groupby(ops, lambda op: isinstance(op[0], pygame.Surface)):
+            if is_image:
+                screen.blits(run, doreturn=False)
+            else:
+                for color, rect, _ in run:
+                    pygame.draw.rect(screen, color, rect)
@@ -0,0 +1,126 @@
+"""Record the input of a game session and replay it deterministically.
+
+Replay a recorded session headless and as fast as possible with:
+
+    python replay.py session.airp
+"""
+# Import modules for the binary format, the settings snapshot and timing
+import json
+import struct
+import sys
+from time import perf_counter
+
+import pygame
+
+# Identify replay files and their format version
+MAGIC = b'AIRP'
+VERSION = 1
+# Header: magic, version, seed, frame count, settings JSON length
+HEADER = struct.Struct('<4sBQII')
+# Record: frame, event kind, key or mouse button, mouse x, mouse y
+RECORD = struct.Struct('<IBihh')
+# Map the recorded event types to compact codes and back
+EVENT_CODES = {pygame.KEYDOWN: 1, pygame.KEYUP: 2, pygame.MOUSEBUTTONDOWN: 3}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+
+def settings_snapshot(settings):
+    """Return the plain-data attributes of settings as a dictionary."""
+    return {name: value for name, value in vars(settings).items()
+        if isinstance(value, (bool, int, float, str, list, tuple, dict, type(None)))}
+
+
+def apply_settings_snapshot(settings, snapshot):
+    """Copy a snapshot taken with settings_snapshot() onto settings."""
+    for name, value in snapshot.items():
+        # JSON turns tuples such as colors into lists; turn them back
+        if isinstance(value, list):
+            value = tuple(value)
+        setattr(settings, name, value)
+
+
+class InputRecorder:
+    """A class to record the input events handled on each frame."""
+
+    def __init__(self, ai_game):
+        """Initialize the recorder with a snapshot of the game's settings."""
+        # Store the game so the seed and frame count can be saved
+        self.ai_game = ai_game
+        # Capture the settings the session starts with
+        self.settings = settings_snapshot(ai_game.settings)
+        # Pack the records into a growing byte buffer
+        self.records = bytearray()
+
+    def record(self, frame, event):
+        """Store event if it is one of the recorded types."""
+        code = EVENT_CODES.get(event.type)
+        if code is None:
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            x, y = event.pos
+            self.records += RECORD.pack(frame, code, event.button, x, y)
+        else:
+            self.records += RECORD.pack(frame, code, event.key, 0, 0)
+
+    def save(self, path):
+        """Write the settings, seed and recorded events to path."""
+        settings = json.dumps(self.settings).encode()
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.ai_game.seed,
+                self.ai_game.frame_count, len(settings)))
+            file.write(settings)
+            file.write(self.records)
+
+
+class InputReplayer:
+    """A class to load a recorded session and play it back."""
+
+    def __init__(self, path):
+        """Load the recording stored at path."""
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, self.seed, self.frames, settings_length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+        start = HEADER.size
+        self.settings = json.loads(data[start:start + settings_length])
+        # Group the recorded events by the frame they were handled on
+        self.events = {}
+        for frame, code, value, x, y in RECORD.iter_unpack(data[start + settings_length:]):
+            if EVENT_TYPES[code] == pygame.MOUSEBUTTONDOWN:
+                event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=value, pos=(x, y))
+            else:
+                event = pygame.event.Event(EVENT_TYPES[code], key=value)
+            self.events.setdefault(frame, []).append(event)
+
+    def make_game(self):
+        """Return a headless game set up like the recorded one."""
+        # Import here to avoid a circular import with alien_invasion
+        from alien_invasion import AlienInvasion
+        from settings import Settings
+        settings = Settings()
+        apply_settings_snapshot(settings, self.settings)
+        # Replays must not record themselves again
+        settings.record_path = None
+        game = AlienInvasion(headless=True, seed=self.seed, settings=settings)
+        # Keep the recorded pauses, since they affect what happens next
+        game.transitions.skip = False
+        return game
+
+    def replay(self, game=None):
+        """Replay the session uncapped and return the game it ran on."""
+        if game is None:
+            game = self.make_game()
+        game.simulate(self.frames, self.events)
+        return game
+
+
+if __name__ == '__main__':
+    replayer = InputReplayer(sys.argv[1])
+    start = perf_counter()
+    game = replayer.replay()
+    elapsed = perf_counter() - start
+    print(f"replayed {replayer.frames} frames in {elapsed:.2f} s "
+        f"({replayer.frames / elapsed:.0f} frames per second)")
+    print(f"score {game.stats.score}, level {game.stats.level}, "
+        f"ships left {game.stats.ships_left}")
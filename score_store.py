@@ -0,0 +1,123 @@
+# Import modules for the JSON file, atomic writes and timestamps
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import suppress
+
+
+def atomic_write(path, data):
+    """Write the bytes data to path atomically, keeping the file's mode.
+
+    The data goes to a temporary file next to path, which is then renamed
+    over it, so a crash never leaves a half-written file. Raises OSError
+    if the file cannot be written.
+    """
+    # Keep the mode of the file being replaced, or use the default mode
+    # for new files, since mkstemp creates files readable by the owner only
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    # Write next to the target so the rename stays on one file system
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+        suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.chmod(temp_path, mode)
+        # Replace the old file in one step
+        os.replace(temp_path, path)
+    except OSError:
+        # Clean up without hiding the error that stopped the write
+        with suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+class HighScoreStore:
+    """A class to keep per-difficulty leaderboards in a small JSON file.
+
+    The file is read the first time a score is asked for, not at startup.
+    New scores are only kept in memory until save() is called at game over
+    or exit, which writes a temporary file and renames it over the old one
+    so a crash never leaves a half-written file. With path=None the scores
+    are kept in memory only.
+    """
+
+    def __init__(self, path, max_entries=10):
+        """Initialize the store for the file at path."""
+        # Store where the scores live and how many to keep per difficulty
+        self.path = path
+        self.max_entries = max_entries
+        # The leaderboards are loaded on first use
+        self._boards = None
+        # Track whether there are scores not yet written to disk
+        self.dirty = False
+
+    def _load(self):
+        """Read the leaderboards from disk, starting empty if that fails."""
+        self._boards = {}
+        if self.path is None:
+            return
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+            for difficulty, entries in data.get('leaderboards', {}).items():
+                # Keep only lists of entries, and entries with a whole-number score
+                if not isinstance(entries, list):
+                    continue
+                entries = [entry for entry in entries if isinstance(entry, dict)
+                    and type(entry.get('score')) is int]
+                # Keep the best scores first, even if the file was edited
+                entries.sort(key=lambda entry: -entry['score'])
+                self._boards[difficulty] = entries[:self.max_entries]
+        except (OSError, ValueError, AttributeError):
+            # A missing or damaged file means no scores yet
+            self._boards = {}
+
+    @property
+    def boards(self):
+        """Return the leaderboards, loading them the first time."""
+        if self._boards is None:
+            self._load()
+        return self._boards
+
+    def leaderboard(self, difficulty):
+        """Return the entries for difficulty, best first."""
+        return self.boards.get(difficulty, [])
+
+    def best(self, difficulty):
+        """Return the best score for difficulty, or 0 if there is none."""
+        entries = self.leaderboard(difficulty)
+        return entries[0]['score'] if entries else 0
+
+    def submit(self, difficulty, score, level):
+        """Add a finished game to its leaderboard if the score qualifies."""
+        if score <= 0:
+            return False
+        entries = self.boards.setdefault(difficulty, [])
+        if len(entries) >= self.max_entries and score <= entries[-1]['score']:
+            return False
+        entries.append({'score': score, 'level': level, 'date': time.strftime('%Y-%m-%d')})
+        # Keep the best scores first, older entries ahead of equal new ones
+        entries.sort(key=lambda entry: -entry['score'])
+        del entries[self.max_entries:]
+        self.dirty = True
+        return True
+
+    def save(self):
+        """Write the leaderboards atomically if any score changed."""
+        if not self.dirty or self.path is None:
+            return
+        data = json.dumps({'version': 1, 'leaderboards': self._boards},
+            separators=(',', ':')).encode()
+        try:
+            atomic_write(self.path, data)
+        except OSError:
+            # Keep playing if the scores cannot be written; try again later
+            return
+        self.dirty = False
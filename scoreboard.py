@@ -1,9 +1,5 @@
 # Import the pygame.font module to render text
 import pygame.font
-# Import the Group class from pygame.sprite to manage groups of sprites
-from pygame.sprite import Group
-# Import the Ship class from the ship module
-from ship import Ship
 
 class Scoreboard:
     """A class to report scoring information."""
@@ -24,6 +20,16 @@ class Scoreboard:
         self.text_color = (30, 30, 30)
         # Create a font object for rendering the score
         self.font = pygame.font.SysFont(None, 30)
+        # Use the game's shared cache of rendered text
+        self.text_cache = ai_game.text_cache
+        # Remember the displayed score text to skip unchanged updates
+        self._score_str = None
+        # Use the ship image as the icon for each life left
+        self.ship_icon = ai_game.assets.load_image('Images/ship.bmp')
+        # Cache one strip of ship icons per number of lives
+        self._ship_strips = {}
+        # Show no more ships than fit in a third of the screen width
+        self.max_ship_icons = max(1, self.screen_rect.width // 3 // self.ship_icon.get_width())
         # Prepare the initial score image
         self.prep_images()
     
@@ -43,9 +49,13 @@ class Scoreboard:
         # Round the score to the nearest 10 using the round() function
         rounded_score = round(self.stats.score, -1)     
         # Format the score as a string with comma separators for thousands
-        score_str = f"Current Score: {rounded_score:,}"   
-        # Render the score string as an image using the font's render method
-        self.score_image = self.font.render(score_str, True, self.text_color, self.settings.bg_color)  
+        score_str = f"Current Score: {rounded_score:,}"
+        # Nothing to do if the displayed score has not changed
+        if score_str == self._score_str:
+            return
+        self._score_str = score_str
+        # Render the score string as an image, reusing a cached one if possible
+        self.score_image = self.text_cache.render(self.font, score_str, self.text_color, self.settings.bg_color)
         # Create a rectangle object for the score image using get_rect() method
         self.score_rect = self.score_image.get_rect()   
         # Position the score rectangle 20 pixels from the right edge of the screen
@@ -60,7 +70,7 @@ class Scoreboard:
         # Create a formatted string for the level display
         level_str = f"Current Level: {level}"
         # Render the level string as an image
-        self.level_image = self.font.render(level_str, True, self.text_color, self.settings.bg_color)
+        self.level_image = self.text_cache.render(self.font, level_str, self.text_color, self.settings.bg_color)
         # Create a rectangle for the level image
         self.level_rect = self.level_image.get_rect()
         # Position the level display below the score
@@ -75,7 +85,7 @@ class Scoreboard:
         # Format the high score with comma separators for thousands
         high_score_str = f"Highest Score: {high_score:,}"
         # Render the high score string as an image
-        self.high_score_image = self.font.render(high_score_str, True, self.text_color, self.settings.bg_color)
+        self.high_score_image = self.text_cache.render(self.font, high_score_str, self.text_color, self.settings.bg_color)
         # Create a rectangle for the high score image
         self.high_score_rect = self.high_score_image.get_rect()
         # Position the high score at the center of the screen horizontally
@@ -85,18 +95,21 @@ class Scoreboard:
 
     def prep_ships(self):
         """Show how many ships are left."""
-        # Create a Group to store the ship sprites
-        self.ships = Group()
-        # Iterate through the number of ships left
-        for ship_number in range(self.stats.ships_left):
-            # Create a new Ship instance
-            ship = Ship(self.ai_game)
-            # Set the x-coordinate of the ship based on its width and position
-            ship.rect.x = 10 + ship_number * ship.rect.width
-            # Set the y-coordinate of the ship
-            ship.rect.y = 10
-            # Add the ship to the Group
-            self.ships.add(ship)
+        ships_left = min(self.stats.ships_left, self.max_ship_icons)
+        # Build the strip for this number of lives only the first time
+        strip = self._ship_strips.get(ships_left)
+        if strip is None and ships_left > 0:
+            width, height = self.ship_icon.get_size()
+            # Create a surface in the icon's pixel format, wide enough for every ship
+            strip = pygame.Surface((width * ships_left, height), 0, self.ship_icon)
+            # Place the ships side by side
+            for ship_number in range(ships_left):
+                strip.blit(self.ship_icon, (ship_number * width, 0))
+            self._ship_strips[ships_left] = strip
+        self.ships_image = strip
+        # Position the strip in the top-left corner of the screen
+        if strip is not None:
+            self.ships_rect = strip.get_rect(topleft=(10, 10))
     
     def check_high_score(self):
         """Check to see if there's a new high score."""
@@ -107,13 +120,18 @@ class Scoreboard:
             # Prepare the new high score for display
             self.prep_high_score()
     
+    def draw_ops(self):
+        """Return the (image, rect) pairs that make up the scoreboard."""
+        # Draw the score, the high score and the level
+        ops = [(self.score_image, self.score_rect),
+            (self.high_score_image, self.high_score_rect),
+            (self.level_image, self.level_rect)]
+        # Draw the ships left as a single strip
+        if self.ships_image is not None:
+            ops.append((self.ships_image, self.ships_rect))
+        return ops
+
     def show_score(self):
         """Draw score to the screen."""
-        # Blit (copy) the score image onto the screen at the position defined by score_rect
-        self.screen.blit(self.score_image, self.score_rect)
-        # Blit the high score image onto the screen
-        self.screen.blit(self.high_score_image, self.high_score_rect)
-        # Blit the level image onto the screen
-        self.screen.blit(self.level_image, self.level_rect)
-        # Blit the ships onto the screen
-        self.ships.draw(self.screen)
\ No newline at end of file
+        # Blit (copy) the score, high score, level and ships onto the screen
+        self.screen.blits(self.draw_ops())
\ No newline at end of file
@@ -1,3 +1,142 @@
+# Import modules to read settings profiles and cache the level tables
+import json
+from functools import lru_cache
+
+# Import pygame for the key codes of the key bindings
+import pygame
+
+# Import the TOML parser if it is available (Python 3.11 and later)
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+# Settings that are set while playing and cannot come from a profile
+DYNAMIC_SETTINGS = {'ship_speed', 'bullet_speed', 'alien_speed', 'alien_points',
+    'fleet_direction', 'level'}
+# Settings that must be greater than zero; every other number may also be zero
+POSITIVE_SETTINGS = {'screen_width', 'screen_height', 'bullet_width', 'bullet_height',
+    'bullets_allowed', 'collision_cell_size', 'timestep', 'speed_reference_fps',
+    'text_cache_size', 'high_score_entries', 'max_frame_time', 'idle_timeout',
+    'swarm_wave_rows', 'swarm_max_aliens', 'alien_bullet_width', 'alien_bullet_height',
+    'bullet_sound_channels', 'explosion_sound_channels'}
+# Settings limited to a few values
+SETTING_CHOICES = {'fleet_backend': ('sprites', 'numpy'), 'game_mode': ('classic', 'endless')}
+
+
+class ProfileError(ValueError):
+    """Raised when a settings profile cannot be read or is not valid."""
+
+
+def key_code(name):
+    """Return the Pygame key code for a key name such as 'space', 'q' or 'f3'."""
+    # Letter keys are lower case (K_q), other keys upper case (K_SPACE)
+    code = getattr(pygame, f'K_{name}', None)
+    if code is None:
+        code = getattr(pygame, f'K_{name.upper()}', None)
+    if code is None:
+        raise ValueError(f"key_bindings: unknown key name {name!r}")
+    return code
+
+
+@lru_cache(maxsize=None)
+def _level_table(ship_speed, bullet_speed, alien_speed, alien_points, level_scale, score_scale):
+    """Return the growing list of per-level values for one set of inputs."""
+    # Start with level 1; later levels are appended on first use
+    return [(ship_speed, bullet_speed, alien_speed, alien_points)]
+
+
+def level_values(ship_speed, bullet_speed, alien_speed, alien_points, level_scale,
+        score_scale, level):
+    """Return (ship_speed, bullet_speed, alien_speed, alien_points) at level.
+
+    Each level's values are computed once from the previous level's, in
+    the same order of float operations every time, and then looked up, so
+    a level always plays exactly the same no matter how it was reached.
+    """
+    table = _level_table(ship_speed, bullet_speed, alien_speed, alien_points,
+        level_scale, score_scale)
+    # Extend the table up to the requested level if needed
+    while len(table) < level:
+        ship, bullet, alien, points = table[-1]
+        table.append((ship * level_scale, bullet * level_scale, alien * level_scale,
+            int(points * score_scale)))
+    return table[level - 1]
+
+
+def _check_value(name, value, default):
+    """Return value converted to the type of default, or raise ProfileError."""
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+        raise ProfileError(f"{name}: expected true or false, got {value!r}")
+    if isinstance(default, (int, float)):
+        # Accept whole numbers for float settings, but not the other way round
+        allowed = (int, float) if isinstance(default, float) else int
+        if isinstance(value, bool) or not isinstance(value, allowed):
+            kind = 'a number' if isinstance(default, float) else 'a whole number'
+            raise ProfileError(f"{name}: expected {kind}, got {value!r}")
+        if name in POSITIVE_SETTINGS and value <= 0:
+            raise ProfileError(f"{name}: must be positive, got {value!r}")
+        if value < 0:
+            raise ProfileError(f"{name}: must not be negative, got {value!r}")
+        return float(value) if isinstance(default, float) else value
+    if isinstance(default, tuple):
+        # Colors and other tuples are written as lists of the same length
+        if not isinstance(value, (list, tuple)) or len(value) != len(default):
+            raise ProfileError(f"{name}: expected a list of {len(default)} values, got {value!r}")
+        return tuple(_check_value(name, item, item_default)
+            for item, item_default in zip(value, default))
+    if isinstance(default, dict):
+        # Tables are merged into the defaults, so a profile may change one entry
+        if not isinstance(value, dict):
+            raise ProfileError(f"{name}: expected a table, got {value!r}")
+        sample = next(iter(default.values()))
+        merged = dict(default)
+        for key, item in value.items():
+            merged[key] = _check_value(f"{name}.{key}", item, default.get(key, sample))
+        return merged
+    if isinstance(default, str) or default is None:
+        # Paths default to None and may be set to a string
+        if isinstance(value, str):
+            return value
+        raise ProfileError(f"{name}: expected a string, got {value!r}")
+    raise ProfileError(f"{name}: cannot be set from a profile")
+
+
+def load_profile(path, settings=None):
+    """Return settings with the profile at path applied to them.
+
+    Profiles are flat .toml or .json files of setting names and values;
+    only the settings they name are changed. A new Settings object is
+    created unless one is given.
+    """
+    # Pick the parser from the file extension
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise ProfileError(f"{path}: reading TOML profiles needs Python 3.11 or later")
+        parse, mode = tomllib.load, 'rb'
+    elif path.endswith('.json'):
+        parse, mode = json.load, 'r'
+    else:
+        raise ProfileError(f"{path}: profiles must be .toml or .json files")
+    try:
+        with open(path, mode) as file:
+            profile = parse(file)
+    except (OSError, ValueError) as error:
+        # Both JSON and TOML syntax errors are ValueErrors
+        raise ProfileError(f"{path}: {error}") from error
+    if not isinstance(profile, dict):
+        raise ProfileError(f"{path}: a profile must be a table of settings")
+    if settings is None:
+        settings = Settings()
+    try:
+        settings.apply_profile(profile)
+    except ProfileError as error:
+        raise ProfileError(f"{path}: {error}") from None
+    return settings
+
+
 class Settings:
     "A class to store all settings for Alien Invasion."
 
@@ -9,6 +148,54 @@ class Settings:
         self.screen_height = 800
         # Set the background color of the game screen (light gray)
         self.bg_color = (230, 230, 230)
+        # Cap the frame rate at this many frames per second (0 for uncapped)
+        self.target_fps = 60
+        # Ask for VSync so frames are shown in step with the display
+        self.vsync = False
+        # Sleep between inputs on the menu instead of redrawing it every frame
+        self.idle_mode = True
+        # Wake from idle sleep at least this often, in seconds
+        self.idle_timeout = 1.0
+        # Bind each action to a key, by the name of its Pygame K_ constant
+        # without the prefix, such as 'space', 'a' or 'f3'
+        self.key_bindings = {
+            'move_left': 'left',
+            'move_right': 'right',
+            'fire': 'space',
+            'quit': 'q',
+            'toggle_profiler': 'f3',
+            'save_snapshot': 'f5',
+            'load_snapshot': 'f9',
+        }
+        # Redraw only the changed parts of the screen instead of the whole frame
+        self.dirty_rendering = True
+        # Set how many rendered text surfaces to keep cached
+        self.text_cache_size = 128
+        # Keep the high scores for each difficulty in this file
+        self.high_score_path = 'high_scores.json'
+        # Set how many scores each difficulty's leaderboard keeps
+        self.high_score_entries = 10
+        # Record the input of the session to this replay file on exit, if set
+        self.record_path = None
+        # Save snapshots of the game to this file (F5 saves, F9 restores)
+        self.snapshot_path = 'snapshot.airs'
+        # Save a snapshot every this many seconds of play, for crash recovery
+        # (0 turns autosaving off)
+        self.autosave_interval = 0.0
+        # Time each phase of every frame from the start (F3 toggles the overlay)
+        self.profile = False
+        # Write the frame timings to this .json or .csv file on exit, if set
+        self.profile_export_path = None
+        # Play sound effects (headless simulations are always silent)
+        self.sound_enabled = True
+        # Open the mixer after the first frame and decode the sounds on a
+        # background thread, instead of before the window appears
+        self.load_sounds_in_background = True
+        # Reserve this many mixer channels for each sound effect
+        self.bullet_sound_channels = 2
+        self.explosion_sound_channels = 3
+        # Let each sound effect start at most this many times per frame
+        self.max_sound_starts_per_frame = 1
         # Set the width of the bullet
         self.bullet_width = 3
         # Set the height of the bullet
@@ -17,10 +204,55 @@ class Settings:
         self.bullet_color = (60, 60, 60)
         # Set the maximum number of bullets allowed on screen at once
         self.bullets_allowed = 5
+        # Set how many shots per second the aliens fire at the ship (0 turns it off)
+        self.alien_fire_rate = 0.0
+        # Set the maximum number of alien bullets on screen at once
+        self.alien_bullets_allowed = 4
+        # Set the size, color (dark red) and speed of the alien bullets
+        self.alien_bullet_width = 3
+        self.alien_bullet_height = 12
+        self.alien_bullet_color = (180, 30, 30)
+        self.alien_bullet_speed = 2.0
+        # Set the size in pixels of the grid cells used for collision checks
+        self.collision_cell_size = 64
+        # Choose the game mode: 'classic' fleets or an 'endless' swarm of waves
+        self.game_mode = 'classic'
+        # In endless mode, send in a new wave this many seconds after the last
+        self.swarm_spawn_interval = 2.0
+        # In endless mode, give each wave this many rows of aliens
+        self.swarm_wave_rows = 2
+        # In endless mode, never have more than this many aliens alive at once
+        self.swarm_max_aliens = 2000
+        # Ignore ship hits and remove aliens that reach the bottom instead, so
+        # soak tests keep their aliens (not meant for normal play)
+        self.invincible = False
+        # Choose how the fleet is moved: 'sprites' or 'numpy' (needs NumPy)
+        self.fleet_backend = 'sprites'
         # Set the speed at which the alien fleet drops down the screen
         self.fleet_drop_speed = 10
         # Set the number of ships (lives) the player has
         self.ship_limit = 3
+        # Set the pause in seconds after the ship is hit
+        self.respawn_pause = 0.5
+        # Set the pause in seconds before a new level starts
+        self.level_start_pause = 0.0
+        # Set the length in seconds of one logical frame in simulations
+        self.timestep = 1 / 60
+        # Express the speeds below in pixels per frame at this frame rate;
+        # movement is scaled by the real frame time, so any frame rate plays
+        # at the same pace
+        self.speed_reference_fps = 60
+        # Advance the game in whole timesteps, running several after a slow
+        # frame, instead of by the measured frame time
+        self.fixed_step = False
+        # Never advance the game by more than this many seconds in one frame
+        self.max_frame_time = 0.1
+        # Set the speeds at the first level, before difficulty scaling
+        self.base_ship_speed = 5.0
+        self.base_bullet_speed = 2.5
+        self.base_alien_speed = 1.0
+        # Set the points for hitting an alien at the first level
+        self.base_alien_points = 50
         # Set the scale factor for increasing game speed
         self.speedup_scale = 1.1
         # Set the scale factor for increasing score
@@ -43,36 +275,64 @@ class Settings:
         # Initialize the dynamic settings
         self.initialize_dynamic_settings()
 
+    def apply_profile(self, profile):
+        """Validate the settings in the profile dictionary and apply them."""
+        errors = []
+        values = {}
+        for name, value in profile.items():
+            # Only settings that exist and are not changed during play are allowed
+            if name in DYNAMIC_SETTINGS or name.startswith('_') or not hasattr(self, name):
+                errors.append(f"{name}: unknown setting")
+                continue
+            try:
+                values[name] = _check_value(name, value, getattr(self, name))
+            except ProfileError as error:
+                errors.append(str(error))
+                continue
+            choices = SETTING_CHOICES.get(name)
+            if choices and value not in choices:
+                errors.append(f"{name}: expected one of {', '.join(choices)}, got {value!r}")
+        # Every bound action must exist and every key name must be a Pygame key
+        for action, key_name in values.get('key_bindings', {}).items():
+            if action not in self.key_bindings:
+                errors.append(f"key_bindings.{action}: unknown action")
+                continue
+            try:
+                key_code(key_name)
+            except ValueError as error:
+                errors.append(str(error))
+        # The difficulty must have a scale factor
+        difficulty = values.get('difficulty', self.difficulty)
+        if difficulty not in values.get('difficulty_scale', self.difficulty_scale):
+            errors.append(f"difficulty: no difficulty_scale entry for {difficulty!r}")
+        # Report every problem at once, and change nothing if there are any
+        if errors:
+            raise ProfileError('; '.join(errors))
+        for name, value in values.items():
+            setattr(self, name, value)
+        # Start from the first level with the new values
+        self.initialize_dynamic_settings()
+
     def initialize_dynamic_settings(self):
         """Initialize settings that change throughout the game."""
-        # Set the base speed for the ship
-        base_ship_speed = 5
-        # Set the base speed for the bullet
-        base_bullet_speed = 2.5
-        # Set the base speed for the alien
-        base_alien_speed = 1.0
-        # Apply difficulty scaling to the speeds
-        scale = self.difficulty_scale[self.difficulty]
-        # Set the ship speed based on difficulty
-        self.ship_speed = base_ship_speed * scale
-        # Set the bullet speed based on difficulty
-        self.bullet_speed = base_bullet_speed * scale
-        # Set the alien speed based on difficulty
-        self.alien_speed = base_alien_speed * scale
+        # Set the speeds and points of the first level
+        self.apply_level(1)
         # Set the initial direction of the alien fleet (1 for right, -1 for left)
         self.fleet_direction = 1
-        # Set the initial point value for hitting an alien
-        self.alien_points = 50
+
+    def apply_level(self, level):
+        """Set the speeds and alien points for level from the level table."""
+        # Apply difficulty scaling to the speeds
+        scale = self.difficulty_scale[self.difficulty]
+        # Look up the values, computing each level only the first time
+        values = level_values(self.base_ship_speed * scale, self.base_bullet_speed * scale,
+            self.base_alien_speed * scale, self.base_alien_points,
+            self.speedup_scale * scale, self.score_scale, level)
+        self.ship_speed, self.bullet_speed, self.alien_speed, self.alien_points = values
+        # Remember which level the values belong to
+        self.level = level
 
     def increase_speed(self):
         """Increase speed settings and alien point values."""
-        # Get the difficulty scaling factor
-        scale = self.difficulty_scale[self.difficulty]
-        # Increase the ship speed
-        self.ship_speed *= self.speedup_scale * scale
-        # Increase the bullet speed
-        self.bullet_speed *= self.speedup_scale * scale
-        # Increase the alien speed
-        self.alien_speed *= self.speedup_scale * scale
-        # Increase the points awarded for hitting an alien
-        self.alien_points = int(self.alien_points * self.score_scale)
\ No newline at end of file
+        # Move on to the values of the next level
+        self.apply_level(self.level + 1)
\ No newline at end of file
@@ -1,5 +1,3 @@
-# Import the pygame module
-import pygame
 # Import the Sprite class from the pygame.sprite module
 from pygame.sprite import Sprite
 
@@ -16,8 +14,8 @@ class Ship(Sprite):
         self.screen_rect = ai_game.screen.get_rect()
         # Store the game's settings object
         self.settings = ai_game.settings
-        # Load the ship image from file
-        self.image = pygame.image.load('images/ship.bmp')
+        # Get the shared ship image from the asset cache
+        self.image = ai_game.assets.load_image('Images/ship.bmp')
         # Get the rectangle of the ship image
         self.rect = self.image.get_rect()
         # Position the ship at the bottom center of the screen
@@ -28,14 +26,20 @@ class Ship(Sprite):
         self.moving_right = False
         self.moving_left = False
 
-    def update(self):
-        """Update the ship's position based on the movement flag."""
+    def update(self, scale=1.0):
+        """Update the ship's position based on the movement flag.
+
+        scale is the length of the frame in reference frames, so the ship
+        covers the same distance per second at any frame rate.
+        """
         # Move the ship right if the flag is set and not at the right edge
         if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.x += self.settings.ship_speed
+            self.x += self.settings.ship_speed * scale
         # Move the ship left if the flag is set and not at the left edge
         if self.moving_left and self.rect.left > 0:
-            self.x -= self.settings.ship_speed
+            self.x -= self.settings.ship_speed * scale
+        # Keep the ship on screen, since one long frame can move it a long way
+        self.x = min(max(self.x, 0.0), self.screen_rect.right - self.rect.width)
         # Update the ship's rectangle position based on the calculated x value
         self.rect.x = self.x
 
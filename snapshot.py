@@ -0,0 +1,263 @@
+"""Save a running game to a compact binary snapshot and restore it.
+
+A snapshot holds the statistics, the dynamic settings, the ship, every
+alien and bullet, the game timers and the random generator's state, so a
+restored game carries on exactly as the original would have. Restore it
+into a game with the same screen size and game mode.
+
+Make a mid-game snapshot to start benchmarks from with:
+
+    python snapshot.py OUTPUT.airs [--frames N] [--seed N] [--profile PATH]
+"""
+# Import modules for the binary format and the random generator's state
+import argparse
+import random
+import struct
+import sys
+from array import array
+
+import pygame
+
+from score_store import atomic_write
+
+# Identify snapshot files and their format version
+MAGIC = b'AISN'
+VERSION = 1
+# Header: magic, version, screen width and height, and the number of
+# aliens, alien columns, bullets and alien bullets stored
+HEADER = struct.Struct('<4sBHHIIII')
+# State: frame count, game active, ships left, score, high score, level,
+# ship, bullet and alien speeds, alien points, fleet direction, ship x,
+# ship rect x, ship moving left and right, alien fire timer, step time,
+# transition time left, swarm spawn timer, swarm waves spawned, and
+# whether the random generator holds a spare Gaussian value, and its value
+STATE = struct.Struct('<Q?qqqidddqbdi??ddddQ?d')
+# Length of the short strings: game mode, difficulty and transition
+TEXT_LENGTH = struct.Struct('<B')
+
+
+def _pack_text(text):
+    """Return text as a length-prefixed UTF-8 string."""
+    data = text.encode()
+    return TEXT_LENGTH.pack(len(data)) + data
+
+
+def _pack_array(typecode, values):
+    """Return values as the little-endian bytes of an array of typecode."""
+    items = array(typecode, values)
+    if sys.byteorder == 'big':
+        items.byteswap()
+    return items.tobytes()
+
+
+class _Reader:
+    """A class to read the parts of a snapshot in order."""
+
+    def __init__(self, data):
+        """Start reading at the beginning of data."""
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, layout):
+        """Read the values of a struct layout."""
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    def text(self):
+        """Read a length-prefixed string."""
+        (length,) = self.unpack(TEXT_LENGTH)
+        return bytes(self._take(length)).decode()
+
+    def array(self, typecode, count):
+        """Read count little-endian items of an array of typecode."""
+        items = array(typecode)
+        items.frombytes(self._take(items.itemsize * count))
+        if sys.byteorder == 'big':
+            items.byteswap()
+        return items
+
+    def _take(self, size):
+        """Return the next size bytes, or raise ValueError if they are missing."""
+        if self.offset + size > len(self.data):
+            raise ValueError("the snapshot is truncated")
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+
+def take_snapshot(game):
+    """Return the state of game as a snapshot."""
+    stats, settings, ship = game.stats, game.settings, game.ship
+    aliens = game.aliens.sprites()
+    columns = game.firing_columns
+    bullets = game.bullets.sprites()
+    alien_bullets = game.alien_bullets.sprites()
+    _, rng_state, gauss = game.rng.getstate()
+    # The swarm only has timers in endless mode
+    spawn_timer, waves_spawned = 0.0, 0
+    if game.swarm is not None:
+        spawn_timer, waves_spawned = game.swarm.spawn_timer, game.swarm.waves_spawned
+    return b''.join([
+        HEADER.pack(MAGIC, VERSION, settings.screen_width, settings.screen_height,
+            len(aliens), len(columns.columns), len(bullets), len(alien_bullets)),
+        STATE.pack(game.frame_count, game.game_active, stats.ships_left, stats.score,
+            stats.high_score, stats.level, settings.ship_speed, settings.bullet_speed,
+            settings.alien_speed, settings.alien_points, settings.fleet_direction,
+            ship.x, ship.rect.x, ship.moving_left, ship.moving_right,
+            game.alien_fire_timer, game.step_time, game.transitions.remaining,
+            spawn_timer, waves_spawned, gauss is not None, gauss or 0.0),
+        _pack_text(settings.game_mode),
+        _pack_text(settings.difficulty),
+        _pack_text(game.transitions.state or ''),
+        _pack_array('I', rng_state),
+        # Store each alien's exact x, its rect position and its firing column
+        _pack_array('d', [alien.x for alien in aliens]),
+        _pack_array('i', [value for alien in aliens for value in alien.rect.topleft]),
+        _pack_array('i', [columns.column_of[alien] for alien in aliens]),
+        _pack_array('i', columns.columns),
+        # Store each bullet's exact y and its rect position
+        _pack_array('d', [bullet.y for bullet in bullets]),
+        _pack_array('i', [value for bullet in bullets for value in bullet.rect.topleft]),
+        _pack_array('d', [bullet.y for bullet in alien_bullets]),
+        _pack_array('i', [value for bullet in alien_bullets for value in bullet.rect.topleft]),
+    ])
+
+
+def restore_snapshot(game, data):
+    """Put game back in the state stored in a snapshot.
+
+    The whole snapshot is read before the game is changed, so a snapshot
+    that cannot be used raises ValueError and leaves the game as it was.
+    """
+    settings = game.settings
+    reader = _Reader(data)
+    try:
+        (magic, version, width, height, alien_count, column_count, bullet_count,
+            alien_bullet_count) = reader.unpack(HEADER)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} snapshot")
+        state = reader.unpack(STATE)
+        game_mode, difficulty, transition = reader.text(), reader.text(), reader.text()
+        rng_state = reader.array('I', 625)
+        alien_x = reader.array('d', alien_count)
+        alien_rects = reader.array('i', 2 * alien_count)
+        alien_columns = reader.array('i', alien_count)
+        column_keys = reader.array('i', column_count)
+        bullet_y = reader.array('d', bullet_count)
+        bullet_rects = reader.array('i', 2 * bullet_count)
+        alien_bullet_y = reader.array('d', alien_bullet_count)
+        alien_bullet_rects = reader.array('i', 2 * alien_bullet_count)
+    except struct.error:
+        raise ValueError("the snapshot is truncated") from None
+    # The positions only make sense on the same screen and in the same mode
+    if (width, height) != (settings.screen_width, settings.screen_height):
+        raise ValueError(f"the snapshot is for a {width}x{height} screen")
+    if game_mode != settings.game_mode:
+        raise ValueError(f"the snapshot is for {game_mode} mode")
+    if difficulty not in settings.difficulty_scale:
+        raise ValueError(f"the snapshot uses an unknown difficulty {difficulty!r}")
+    # Every alien must belong to one of the stored columns, and every column
+    # must hold an alien, or picking a shooter would fail later
+    if (len(set(column_keys)) != len(column_keys)
+            or set(alien_columns) != set(column_keys)):
+        raise ValueError("the snapshot's firing columns do not match its aliens")
+    (frame_count, game_active, ships_left, score, high_score, level, ship_speed,
+        bullet_speed, alien_speed, alien_points, fleet_direction, ship_x, ship_rect_x,
+        moving_left, moving_right, alien_fire_timer, step_time, transition_time,
+        spawn_timer, waves_spawned, has_gauss, gauss) = state
+    # Try the random generator's state on a spare generator first, since
+    # setstate() rejects a damaged state with ValueError
+    rng_state = (3, tuple(rng_state), gauss if has_gauss else None)
+    random.Random().setstate(rng_state)
+
+    # Restore the statistics, settings, timers and random generator
+    game.stats.ships_left, game.stats.score = ships_left, score
+    game.stats.high_score, game.stats.level = high_score, level
+    settings.difficulty = difficulty
+    settings.ship_speed, settings.bullet_speed = ship_speed, bullet_speed
+    settings.alien_speed, settings.alien_points = alien_speed, alien_points
+    settings.fleet_direction, settings.level = fleet_direction, level
+    game.game_active = game_active
+    game.frame_count, game.step_time = frame_count, step_time
+    game.alien_fire_timer = alien_fire_timer
+    game.rng.setstate(rng_state)
+    # Set the running pause directly, since a skipping state machine would drop it
+    game.transitions.cancel()
+    if transition:
+        game.transitions.state, game.transitions.remaining = transition, transition_time
+
+    # Put the ship back
+    game.ship.x, game.ship.rect.x = ship_x, ship_rect_x
+    game.ship.moving_left, game.ship.moving_right = moving_left, moving_right
+
+    # Replace the aliens, reusing the fleet's aliens or the swarm's pool
+    game._clear_aliens()
+    if game.swarm is None:
+        fleet = game.fleet_aliens
+        while len(fleet) < alien_count:
+            fleet.append(game.alien_pool.acquire())
+        aliens = fleet[:alien_count]
+    else:
+        aliens = [game.alien_pool.acquire() for _ in range(alien_count)]
+    for index, alien in enumerate(aliens):
+        alien.x = alien_x[index]
+        alien.rect.topleft = (alien_rects[2 * index], alien_rects[2 * index + 1])
+    game.aliens.add(aliens)
+    game.firing_columns.restore(column_keys, aliens, alien_columns)
+    if game.array_fleet is not None:
+        game.array_fleet.bind(aliens)
+    game.alien_grid.build(game.aliens)
+    # Pick up the stream of waves where it was
+    if game.swarm is not None and waves_spawned:
+        game.swarm.resume(game._alien_size(), waves_spawned, spawn_timer)
+
+    # Replace the ship's and the aliens' bullets
+    for group, pool, y_values, rects in (
+            (game.bullets, game.bullet_pool, bullet_y, bullet_rects),
+            (game.alien_bullets, game.alien_bullet_pool, alien_bullet_y, alien_bullet_rects)):
+        pool.release_group(group)
+        for index, y in enumerate(y_values):
+            bullet = pool.acquire()
+            bullet.y = y
+            bullet.rect.topleft = (rects[2 * index], rects[2 * index + 1])
+            group.add(bullet)
+
+    # Redraw the scoreboard and the whole screen, and hide the cursor in play
+    game.scoreboard.prep_images()
+    game.renderer.invalidate()
+    pygame.mouse.set_visible(not game_active)
+
+
+def save_snapshot(game, path):
+    """Write a snapshot of game to path atomically."""
+    atomic_write(path, take_snapshot(game))
+
+
+def load_snapshot(game, path):
+    """Restore game from the snapshot stored at path."""
+    with open(path, 'rb') as file:
+        restore_snapshot(game, file.read())
+
+
+if __name__ == '__main__':
+    # Import here to avoid a circular import with alien_invasion
+    from alien_invasion import AlienInvasion
+    from batch_runner import SimplePlayer
+    from settings import load_profile
+
+    parser = argparse.ArgumentParser(description="Play a headless game and snapshot it.")
+    parser.add_argument('output')
+    parser.add_argument('--frames', type=int, default=3600)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profile', help='settings profile to play with')
+    args = parser.parse_args()
+
+    settings = load_profile(args.profile) if args.profile else None
+    game = AlienInvasion(headless=True, seed=args.seed, settings=settings)
+    game.start_game()
+    game.simulate(args.frames, SimplePlayer())
+    save_snapshot(game, args.output)
+    print(f"saved frame {game.frame_count} to {args.output}: score {game.stats.score}, "
+        f"level {game.stats.level}, {len(game.aliens)} aliens, "
+        f"{len(game.bullets) + len(game.alien_bullets)} bullets")
@@ -1,24 +1,164 @@
+# Import the threading module to load sounds in the background
+import threading
 import pygame
 
+class VoiceGroup:
+    """A class to play one sound on its own set of reserved mixer channels."""
+
+    def __init__(self, sound, channels, max_starts_per_frame):
+        """Initialize the group with its sound and channels."""
+        # Store the sound and the channels reserved for it
+        self.sound = sound
+        self.channels = list(channels)
+        # Store how many times the sound may start within one frame
+        self.max_starts_per_frame = max_starts_per_frame
+        # Count the starts in the current frame
+        self.starts = 0
+        # Keep the channels in the order they were last started, oldest first
+        self._started = list(self.channels)
+
+    def play(self):
+        """Play the sound on a free channel, or steal the oldest voice."""
+        # Drop the request if the sound has no channels or already started
+        # enough this frame
+        if not self._started or self.starts >= self.max_starts_per_frame:
+            return
+        self.starts += 1
+        # Prefer a channel that is not playing anything
+        for channel in self._started:
+            if not channel.get_busy():
+                break
+        else:
+            # Otherwise cut off the voice that started longest ago
+            channel = self._started[0]
+        channel.play(self.sound)
+        # Mark the channel as the most recently started
+        self._started.remove(channel)
+        self._started.append(channel)
+
+
 class SoundEffects:
     """A class to manage sound effects for the game."""
 
-    def __init__(self):
-        """Initialize sound effects."""
-        # Initialize the pygame mixer
-        pygame.mixer.init()
+    def __init__(self, ai_game, background=False):
+        """Initialize sound effects.
+
+        With background=True nothing is loaded until open() is called,
+        which the game does once the first frame is on screen; the mixer
+        is then opened on the calling thread, since SDL must initialize
+        its audio subsystem on the main thread, and the sounds are decoded
+        on a separate thread. Sounds played before loading finishes are
+        skipped.
+        """
+        # Store the game settings for later use
+        self.settings = ai_game.settings
+        # No sounds are available until they have been loaded
+        self.bullet_voices = None
+        self.explosion_voices = None
+        # Signal when loading has finished
+        self.ready = threading.Event()
+        # Remember whether to decode on a background thread, and whether
+        # the mixer has been opened yet
+        self.background = background
+        self.opened = False
+        # Load the sounds now unless loading is deferred
+        if not background:
+            self.open()
 
-        # Load the bullet sound effect
-        self.bullet_sound = pygame.mixer.Sound('sounds/bullet.wav')
-        # Load the explosion sound effect
-        self.explosion_sound = pygame.mixer.Sound('sounds/explosion.wav')
+    def open(self):
+        """Open the mixer on this thread and load the sounds, only once."""
+        if self.opened:
+            return
+        self.opened = True
+        try:
+            channels = self._open_mixer()
+        except pygame.error:
+            # Play without sound if no audio device is available
+            self.ready.set()
+            return
+        # Decode the sounds now or on a background thread
+        if self.background:
+            threading.Thread(target=self._load, args=(channels,), daemon=True).start()
+        else:
+            self._load(channels)
+
+    def _open_mixer(self):
+        """Initialize the mixer and return the channels reserved for the effects."""
+        # Open the mixer in the 44.1 kHz, 16-bit format of the sound files,
+        # so each sound is converted once at load time and never resampled
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        # Reserve a fixed set of channels for each effect
+        count = self.settings.bullet_sound_channels + self.settings.explosion_sound_channels
+        pygame.mixer.set_num_channels(max(8, count))
+        pygame.mixer.set_reserved(count)
+        return [pygame.mixer.Channel(i) for i in range(count)]
+
+    def _load(self, channels):
+        """Load the sound effects onto their reserved channels."""
+        try:
+            bullet_count = self.settings.bullet_sound_channels
+            max_starts = self.settings.max_sound_starts_per_frame
+            # Load the bullet sound effect on its own channels
+            bullet_voices = VoiceGroup(pygame.mixer.Sound('sounds/bullet.wav'),
+                channels[:bullet_count], max_starts)
+            # Load the explosion sound effect on its own channels
+            explosion_voices = VoiceGroup(pygame.mixer.Sound('sounds/explosion.wav'),
+                channels[bullet_count:], max_starts)
+        except (pygame.error, OSError):
+            # Play without sound if a sound is missing or cannot be decoded
+            pass
+        else:
+            # Publish the sounds only once both have loaded
+            self.bullet_voices = bullet_voices
+            self.explosion_voices = explosion_voices
+        finally:
+            self.ready.set()
+
+    def wait(self, timeout=None):
+        """Block until the sounds are loaded; return True if they are."""
+        return self.ready.wait(timeout)
+
+    def begin_frame(self):
+        """Reset the per-frame limits on how often each sound may start."""
+        # Check each sound on its own, since the loader thread sets them in turn
+        for voices in (self.bullet_voices, self.explosion_voices):
+            if voices is not None:
+                voices.starts = 0
 
     def play_bullet_sound(self):
         """Play the bullet sound effect."""
-        # Play the bullet sound
-        self.bullet_sound.play()
+        # Play the bullet sound once it has been loaded
+        if self.bullet_voices is not None:
+            self.bullet_voices.play()
 
     def play_explosion_sound(self):
         """Play the explosion sound effect."""
-        # Play the explosion sound
-        self.explosion_sound.play()
\ No newline at end of file
+        # Play the explosion sound once it has been loaded
+        if self.explosion_voices is not None:
+            self.explosion_voices.play()
+
+
+class NullSoundEffects:
+    """A silent stand-in for SoundEffects that never touches the mixer."""
+
+    def __init__(self, ai_game=None, background=False):
+        """Initialize the silent sound effects."""
+        # There is nothing to load, so the sounds are always ready
+        self.ready = threading.Event()
+        self.ready.set()
+
+    def wait(self, timeout=None):
+        """Return True at once; there is nothing to load."""
+        return True
+
+    def open(self):
+        """Do nothing."""
+
+    def begin_frame(self):
+        """Do nothing."""
+
+    def play_bullet_sound(self):
+        """Do nothing."""
+
+    def play_explosion_sound(self):
+        """Do nothing."""
@@ -0,0 +1,37 @@
+# Import the pygame module
+import pygame
+
+class SpriteAtlas:
+    """A class to pack several images into one converted surface.
+
+    Each image is stored at its own area of the atlas, so any number of
+    sprites can be drawn with one Surface.blits() call of
+    (atlas surface, destination, area) triples.
+    """
+
+    def __init__(self, images):
+        """Pack images, a dictionary of names to Surfaces or (size, color) pairs."""
+        # Place the images side by side in the order given
+        self.areas = {}
+        x = 0
+        height = 0
+        for name, image in images.items():
+            width, image_height = image.get_size() if isinstance(image, pygame.Surface) else image[0]
+            self.areas[name] = pygame.Rect(x, 0, width, image_height)
+            x += width
+            height = max(height, image_height)
+        # Create the atlas in the display's pixel format so blits need no conversion
+        self.surface = pygame.Surface((max(x, 1), max(height, 1)))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        # Copy each image, or fill each plain-color area
+        for name, image in images.items():
+            area = self.areas[name]
+            if isinstance(image, pygame.Surface):
+                self.surface.blit(image, area)
+            else:
+                self.surface.fill(image[1], area)
+
+    def area(self, name):
+        """Return the area of the atlas holding the named image."""
+        return self.areas[name]
@@ -0,0 +1,116 @@
+# Import the fleet layout to give each wave the shape of the classic fleet
+from fleet import fleet_layout
+
+
+def wave_layouts(screen_width, screen_height, alien_width, alien_height, rows):
+    """Yield the starting positions of each new wave, forever.
+
+    A wave is the top rows of the classic fleet layout; every other wave
+    is shifted one alien width to the right so the columns interleave.
+    """
+    # Keep the positions in the first rows of the cached fleet layout
+    last_row_y = alien_height + 2 * alien_height * (rows - 1)
+    wave = [(x, y) for x, y in fleet_layout(screen_width, screen_height,
+        alien_width, alien_height) if y <= last_row_y]
+    shifted = [(x + alien_width, y) for x, y in wave]
+    while True:
+        yield wave
+        yield shifted
+
+
+class Swarm:
+    """A class to stream waves of aliens into the game in endless mode.
+
+    New waves enter above the highest alien still alive, so they come into
+    view as the swarm drops, lined up with the columns of the swarm below
+    them however far it has drifted sideways, and arrive every
+    swarm_spawn_interval seconds
+    as long as the number of live aliens stays below swarm_max_aliens.
+    Destroyed aliens go back to the alien pool for later waves.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize the swarm."""
+        # Store the game and its settings for later use
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+        # No waves are queued until the swarm starts
+        self.waves = None
+        self.next_wave = None
+        # Track the seconds since the last wave and how many waves came in
+        self.spawn_timer = 0.0
+        self.waves_spawned = 0
+
+    def start(self, alien_size):
+        """Start streaming waves from the top of the screen."""
+        self.resume(alien_size, 0, 0.0)
+        # Send in the first wave at once
+        self._spawn()
+
+    def resume(self, alien_size, waves_spawned, spawn_timer):
+        """Carry on streaming after waves_spawned waves, as from a snapshot."""
+        # Build the pipeline of wave layouts for this screen and alien size
+        self.alien_width, self.alien_height = alien_size
+        self.waves = wave_layouts(self.settings.screen_width, self.settings.screen_height,
+            *alien_size, self.settings.swarm_wave_rows)
+        self.next_wave = next(self.waves)
+        # The layouts repeat every two waves, so skip to the one due next
+        for _ in range(waves_spawned % 2):
+            self.next_wave = next(self.waves)
+        self.spawn_timer = spawn_timer
+        self.waves_spawned = waves_spawned
+
+    def update(self, dt):
+        """Send in the next wave if it is due and the alien cap allows it."""
+        self.spawn_timer += dt
+        aliens = self.ai_game.aliens
+        # Wait for the spawn interval, unless every alien has been destroyed
+        if aliens and self.spawn_timer < self.settings.swarm_spawn_interval:
+            return
+        # Hold the wave back while it would take the swarm over the cap
+        if len(aliens) + len(self.next_wave) > self.settings.swarm_max_aliens:
+            return
+        self._spawn()
+
+    def _spawn(self):
+        """Add the next wave of aliens above the highest living alien."""
+        game = self.ai_game
+        wave = self.next_wave
+        # Stack the wave's bottom row two alien heights above the highest
+        # alien, or at the normal starting rows if the swarm is low enough
+        height = self.alien_height
+        offset = 0
+        shift = 0.0
+        if game.aliens:
+            swarm = game.aliens.sprites()
+            top = min(alien.rect.top for alien in swarm)
+            offset = min(0, top - 2 * height - wave[-1][1])
+            # The layouts sit on a grid one alien width apart; move the wave
+            # sideways as far as the swarm has drifted off that grid, so
+            # every new alien lines up with a column of the swarm
+            width = self.alien_width
+            shift = swarm[0].x % width
+            # Keep a wave that would stick out on the right on screen, two
+            # widths to the left so it still interleaves with the last one
+            if max(x for x, _ in wave) + width + shift >= self.settings.screen_width:
+                shift -= 2 * width
+        # Take the aliens from the pool and place them
+        aliens = []
+        for x_position, y_position in wave:
+            alien = game.alien_pool.acquire()
+            alien.x = x_position + shift
+            alien.rect.topleft = (alien.x, y_position + offset)
+            aliens.append(alien)
+        game.aliens.add(aliens)
+        # Regroup the firing columns, since the older aliens have moved
+        # since they were sorted into them
+        game.firing_columns.rebuild(game.aliens)
+        # Reload the NumPy fleet arrays with the live aliens, if they are used
+        if game.array_fleet is not None:
+            game.array_fleet.bind(game.aliens.sprites())
+        # Index the new wave for this frame's collision checks
+        game.alien_grid.build(game.aliens)
+        # Queue the following wave and restart the timer
+        self.next_wave = next(self.waves)
+        self.spawn_timer = 0.0
+        self.waves_spawned += 1
@@ -0,0 +1,44 @@
+# Import OrderedDict to keep cached surfaces in least-recently-used order
+from collections import OrderedDict
+
+class TextCache:
+    """A least-recently-used cache of rendered text surfaces.
+
+    Surfaces are keyed by (text, color, background, font), so a label or
+    score that has not changed is never rendered twice.
+    """
+
+    def __init__(self, max_size=128):
+        """Initialize an empty cache holding at most max_size surfaces."""
+        # Store the maximum number of surfaces to keep
+        self.max_size = max_size
+        # Map each key to its rendered surface, oldest first
+        self.surfaces = OrderedDict()
+        # Count cache hits, renders and evictions for profiling
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, background=None):
+        """Return text rendered with font, reusing a cached surface if possible."""
+        key = (text, color, background, font)
+        # Serve the surface from the cache and mark it as recently used
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        # Otherwise render the text with anti-aliasing
+        surface = font.render(text, True, color, background)
+        self.misses += 1
+        self.surfaces[key] = surface
+        # Drop the least recently used surface if the cache is full
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        """Return the cache counters as a dictionary."""
+        return {'hits': self.hits, 'misses': self.misses,
+            'evictions': self.evictions, 'cached': len(self.surfaces)}
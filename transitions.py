@@ -0,0 +1,47 @@
+class Transitions:
+    """A small state machine for pauses such as respawning or a level start.
+
+    While a transition is running, the game keeps handling events and
+    drawing frames but does not advance gameplay. The transition ends once
+    enough game-clock time has passed, so the main loop never blocks.
+    """
+
+    def __init__(self, skip=False):
+        """Initialize with no transition running.
+
+        With skip=True every transition ends immediately, which lets
+        headless simulations run without waiting.
+        """
+        # Store whether transitions should be skipped entirely
+        self.skip = skip
+        # Store the name of the running transition, or None
+        self.state = None
+        # Store how many seconds of the transition are left
+        self.remaining = 0.0
+
+    @property
+    def active(self):
+        """Return True while a transition is running."""
+        return self.state is not None
+
+    def start(self, state, duration):
+        """Start the transition state lasting duration seconds."""
+        # Do nothing if transitions are skipped or the pause is empty
+        if self.skip or duration <= 0:
+            return
+        self.state = state
+        self.remaining = duration
+
+    def update(self, dt):
+        """Advance the running transition by dt seconds of game time."""
+        if self.state is None:
+            return
+        self.remaining -= dt
+        # End the transition once its time is up, allowing for float rounding
+        if self.remaining <= 1e-9:
+            self.cancel()
+
+    def cancel(self):
+        """Stop any running transition."""
+        self.state = None
+        self.remaining = 0.0